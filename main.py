@@ -6,6 +6,9 @@ from modules import StartScreen, config
 
 def main():
     """Method to run the scrabble game"""
+    # Compile the dictionary in the background while the start screen is shown
+    config.DICTIONARY.start()
+
     window = arcade.Window(
         config.WINDOW_WIDTH, config.WINDOW_HEIGHT, config.WINDOW_TITLE
     )
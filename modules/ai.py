@@ -1,15 +1,17 @@
 """Module that contains the definition for an AI object
 as well as the methods for maintaining cross-check-sets"""
 
+from time import perf_counter
 from .config import SIZE
-from .board import Board, EMPTY_TILES, CROSS_CHECKS_ACROSS, CROSS_CHECKS_DOWN
-from .tile import Tile
-from .utils import (
-    find_permutations_recursive,
-    copy_list,
-)
+from .board import Board, EMPTY_TILES, CENTER_COORDS
+from .tile import Tile, SLOT_KEYS, BLANK_SLOT
+from .utils import copy_list
+from .lexicon import EMPTY_SQUARE, letter_mask
 from .player import Player
+from .rack import Rack
 from .drawbag import Drawbag
+from .opening_book import BookMove, get_opening_book
+from .profiler import PROFILER, SearchStats
 
 
 class AI(Player):
@@ -27,6 +29,11 @@ class AI(Player):
             1 = Most words
             2 = Most tiles
             3 = Longest word
+        stats (SearchStats): Counts the work of the move being chosen while
+            profiling, otherwise None so the search counts nothing
+        last_turn_stats (dict(str, float)): How the time of the last move chosen was spent,
+            as generation, validation and scoring milliseconds, and the moves tested
+            and trie nodes visited, or empty if it was chosen while not profiling
     """
 
     def __init__(self, name: str, drawbag: Drawbag, board: Board, personality: int = 0):
@@ -35,142 +42,116 @@ class AI(Player):
         self.testing_board = []
         self.curr_cross_checks = []
         self.personality = personality
+        self.stats: SearchStats = None
+        self.last_turn_stats: dict[str, float] = {}
 
-    def find_moves(
-        self,
-    ) -> list[list[tuple[Tile, tuple[int, int]]]]:
+    def find_moves(self, rack: Rack = None) -> list[list[tuple[Tile, tuple[int, int]]]]:
         """
         Assembles a list of all possible moves
         (optimistic, moves not verified yet)
         """
-        possible_moves_across: list[list[tuple[Tile, tuple[int, int]]]] = []
-        possible_moves_down: list[list[tuple[Tile, tuple[int, int]]]] = []
+        return list(self.iter_moves(rack))
+
+    def iter_moves(self, rack: Rack = None):
+        """
+        Yields every possible move for a rack, the AI's own by default, across
+        moves first, finding each one only when it is asked for
+        (optimistic, moves not verified yet)
+        """
+        if rack is None:
+            rack = self.rack
 
         self.testing_board = copy_list(self.board.get_board())
-        self.curr_cross_checks = CROSS_CHECKS_ACROSS
+        self.curr_cross_checks = self.board.cross_checks_across
 
         for row in range(SIZE):
             if True in [
                 self.is_anchor(self.testing_board, row, col) for col in range(SIZE)
             ]:
-                possible_moves_across += self.moves_in_row(row)
+                yield from self.moves_in_row(row, rack)
 
         self.testing_board = self.transpose_board()
-        self.curr_cross_checks = CROSS_CHECKS_DOWN
+        self.curr_cross_checks = [
+            list(column) for column in zip(*self.board.cross_checks_down)
+        ]
 
         for row in range(SIZE):
             if True in [
                 self.is_anchor(self.testing_board, row, col) for col in range(SIZE)
             ]:
-                possible_moves_down += self.moves_in_row(row)
+                for move in self.moves_in_row(row, rack):
+                    yield [(tile, coords[::-1]) for tile, coords in move]
 
-        for move in possible_moves_down:
-            for i, tile in enumerate(move):
-                move[i] = (tile[0], tile[1][::-1])
-        return possible_moves_across + possible_moves_down
+    def has_legal_move(self, rack: Rack = None) -> bool:
+        """
+        Returns whether any valid move can be played with a rack, the AI's own
+        by default, stopping the search at the first one found
+        """
+        return any(self.board.test_turn(move)[0] for move in self.iter_moves(rack))
 
-    def moves_in_row(self, row: int) -> list[list[tuple[Tile, tuple[int, int]]]]:
+    def moves_in_row(self, row: int, rack: Rack):
         """
-        Finds all of the possible moves in the passed row
+        Yields all of the possible moves in the passed row
 
         Also works for columns when the board is transposed
         """
-        possible_moves: list[list[tuple[Tile, tuple[int, int]]]] = []
-
-        letters_in_row = []
-        letters_in_word = ""
-        for tile in self.testing_board[row]:
-            if tile not in EMPTY_TILES:
-                letters_in_word += tile.letter
-            else:
-                if letters_in_word != "":
-                    letters_in_row.append(letters_in_word)
-                letters_in_word = ""
-
-        possible_words = find_permutations_recursive(
-            self.rack.get_rack_letters() + letters_in_row, []
+        line = "".join(
+            EMPTY_SQUARE if tile in EMPTY_TILES else tile.letter
+            for tile in self.testing_board[row]
         )
+        allowed = [
+            letter_mask(cross_check) for cross_check in self.curr_cross_checks[row]
+        ]
+        anchors = [self.is_anchor(self.testing_board, row, col) for col in range(SIZE)]
+
+        counts = rack.get_counts()
+        letters = "".join(
+            letter * count for letter, count in zip(SLOT_KEYS, counts[:BLANK_SLOT])
+        )
+        wildcards = counts[BLANK_SLOT]
 
-        for word in possible_words:
-            first_letter = word[0]
-
-            for col in range(SIZE - len(word)):
-                tile = self.testing_board[row][col]
-
-                if (
-                    tile.letter == first_letter
-                    and col + len(word) <= SIZE
-                    or tile in EMPTY_TILES
-                ):
-                    possible_moves += self.find_move(
-                        word, (row, col), [], [], self.get_rack_tiles()
-                    )
-
-        return possible_moves
+        for start, word, blanks in self.board.get_lexicon().match_line(
+            line, allowed, letters, wildcards, anchors, stats=self.stats
+        ):
+            yield self.place_word(row, start, word, blanks, line, rack)
 
-    # suppress warning for too many parameters
+    # suppress warning for too many arguments
     # pylint: disable=R0913,R0917
-    def find_move(
+    def place_word(
         self,
-        target: str,
-        coords: tuple[int, int],
-        curr_move: list[tuple[Tile, tuple[int, int]]],
-        possible_moves: list[list[tuple[Tile, tuple[int, int]]]],
-        remaining_rack: list[Tile],
-    ):
-        """Recursives traverses the row to the right to try and construct the target"""
-
-        if target == "":
-            if curr_move not in (possible_moves + []):
-                possible_moves.append(curr_move)
-            return possible_moves
-
-        if coords is None:
-            return possible_moves
-
-        square = self.testing_board[coords[0]][coords[1]]
-        next_letter = target[0]
-        curr_move = copy_list(curr_move)
-        remaining_rack = copy_list(remaining_rack)
-
-        if square not in EMPTY_TILES:
-            if square.letter == next_letter:
-                return self.find_move(
-                    target[1:],
-                    self.next_coords(coords),
-                    curr_move,
-                    possible_moves,
-                    remaining_rack,
-                )
-            return possible_moves
-
-        if next_letter in self.curr_cross_checks[coords[0]][coords[1]]:
-            for tile in remaining_rack.copy():
-                if tile.letter in [next_letter, ""]:
-                    if tile.letter == "":
-                        new_tile = Tile.copy(tile)
-                        new_tile.set_blank(next_letter)
-                        curr_move.append((new_tile, coords))
-                    else:
-                        curr_move.append((tile, coords))
-                    remaining_rack.remove(tile)
-                    return self.find_move(
-                        target[1:],
-                        self.next_coords(coords),
-                        curr_move,
-                        possible_moves,
-                        remaining_rack,
-                    )
-        return possible_moves
-
-    def next_coords(self, coords: tuple[int, int]) -> tuple[int, int] | None:
-        """
-        Returns the coordinates of the next square in the row, or
-        None if passed square is the end of the row
-        """
-        if coords[1] + 1 < SIZE:
-            return (coords[0], coords[1] + 1)
-        return None
+        row: int,
+        start: int,
+        word: str,
+        blanks: tuple[int, ...],
+        line: str,
+        rack: Rack = None,
+    ) -> list[tuple[Tile, tuple[int, int]]]:
+        """
+        Takes the rack tiles needed to spell word from column start of a row,
+        playing the columns in blanks with blank tiles
+        """
+        if rack is None:
+            rack = self.rack
+
+        rack_tiles = list(rack.get_rack())
+        move: list[tuple[Tile, tuple[int, int]]] = []
+
+        for col, letter in enumerate(word, start):
+            if line[col] != EMPTY_SQUARE:
+                continue
+
+            if col in blanks:
+                tile = next(tile for tile in rack_tiles if tile.letter == "")
+                rack_tiles.remove(tile)
+                new_tile = Tile.copy(tile)
+                new_tile.set_blank(letter)
+                move.append((new_tile, (row, col)))
+            else:
+                tile = next(tile for tile in rack_tiles if tile.letter == letter)
+                rack_tiles.remove(tile)
+                move.append((tile, (row, col)))
+
+        return move
 
     def transpose_board(self):
         """
@@ -191,20 +172,64 @@ class AI(Player):
 
         Returns True of False depending on if a valid move was found
         """
-        moves = self.find_moves()
-        valid_moves = {}
+        self.stats = SearchStats() if PROFILER.enabled else None
+        if self.stats is not None:
+            start = perf_counter()
+
+        if self.board.is_empty(*CENTER_COORDS):
+            chosen_moves = self.opening_moves()
+        else:
+            chosen_moves = self.rank_moves(self.find_moves())
+
+        self.last_turn_stats = {}
+        if self.stats is not None:
+            self.last_turn_stats = self.get_turn_stats(perf_counter() - start)
+            self.stats = None
+
+        chosen_move = chosen_moves[self.personality]
+
+        if chosen_move is None:
+            return False
+
+        for tile in chosen_move:
+            if tile[0].value == 0:
+                self.rack.remove_letter("")
+            else:
+                self.rack.remove_letter(tile[0].letter)
+            self.board.update_tile(tile[1][0], tile[1][1], tile[0])
+        return True
+
+    def get_turn_stats(self, duration: float) -> dict[str, float]:
+        """
+        Returns how the time of a move search lasting duration seconds was spent,
+        from the work counted in stats
+        """
+        stats = self.stats
+        # Time not spent testing moves was spent generating them
+        generation_time = duration - stats.validation_time - stats.scoring_time
+        return {
+            "generation_ms": generation_time * 1000,
+            "validation_ms": stats.validation_time * 1000,
+            "scoring_ms": stats.scoring_time * 1000,
+            "moves_tested": stats.moves_tested,
+            "nodes_visited": stats.nodes_visited,
+        }
+
+    def rank_moves(
+        self, moves: list[list[tuple[Tile, tuple[int, int]]]]
+    ) -> list[list[tuple[Tile, tuple[int, int]]] | None]:
+        """
+        Returns the valid move each personality would choose from moves,
+        or None for every personality if no move is valid
+        """
         max_stats = [0, 0, 0, 0]
         chosen_moves = [None, None, None, None]
         for move in moves:
-            is_valid, words, is_bingo = self.board.test_turn(move)
+            is_valid, words, is_bingo = self.board.test_turn(move, self.stats)
 
             if is_valid:
                 score = sum(words.values()) + (is_bingo * 50)
 
-                if score not in valid_moves:
-                    valid_moves[score] = []
-                valid_moves[score].append(move)
-
                 if score > max_stats[0]:
                     max_stats[0] = score
                     chosen_moves[0] = move
@@ -219,18 +244,46 @@ class AI(Player):
                         max_stats[3] = len(word)
                         chosen_moves[3] = move
 
-        chosen_move = chosen_moves[self.personality]
+        return chosen_moves
 
-        if chosen_move is None:
-            return False
-
-        for tile in chosen_move:
-            if tile[0].value == 0:
-                self.rack.remove_letter("")
-            else:
-                self.rack.remove_letter(tile[0].letter)
-            self.board.update_tile(tile[1][0], tile[1][1], tile[0])
-        return True
+    def opening_moves(self) -> list[list[tuple[Tile, tuple[int, int]]] | None]:
+        """
+        Returns the first move of the game each personality would choose,
+        looking the rack up in the opening book and searching only on a miss
+        """
+        book = get_opening_book(self.board.get_lexicon())
+        key = self.rack.key()
+        book_moves = book.get(key)
+
+        if book_moves is not None:
+            return [
+                None if book_move is None else self.book_move_to_move(book_move)
+                for book_move in book_moves
+            ]
+
+        chosen_moves = self.rank_moves(self.find_moves())
+        book_moves = [
+            None if move is None else move_to_book_move(move) for move in chosen_moves
+        ]
+
+        # Moves off the center row cannot be stored, which an empty board never gives
+        if all(
+            move is None or book_move is not None
+            for move, book_move in zip(chosen_moves, book_moves)
+        ):
+            book.add(key, book_moves)
+
+        return chosen_moves
+
+    def book_move_to_move(
+        self, book_move: BookMove
+    ) -> list[tuple[Tile, tuple[int, int]]]:
+        """Takes the rack tiles needed to play a move stored in the opening book"""
+        start, word, blank_mask = book_move
+        blanks = tuple(start + i for i in range(len(word)) if blank_mask & (1 << i))
+        return self.place_word(
+            CENTER_COORDS[0], start, word, blanks, EMPTY_SQUARE * SIZE
+        )
 
     def is_anchor(self, board: list[list[Tile]], row: int, col: int):
         """
@@ -253,3 +306,19 @@ class AI(Player):
             if board[row][col - 1] not in EMPTY_TILES:
                 return True
         return (row, col) == (7, 7)
+
+
+def move_to_book_move(move: list[tuple[Tile, tuple[int, int]]]) -> BookMove | None:
+    """
+    Returns a first move as stored in the opening book,
+    or None if it is not an across move on the center row
+    """
+    squares = sorted(move, key=lambda tile: tile[1][1])
+    if any(coords[0] != CENTER_COORDS[0] for _, coords in squares):
+        return None
+
+    start = squares[0][1][1]
+    word = "".join(tile.letter for tile, _ in squares)
+    blank_mask = sum(1 << i for i, (tile, _) in enumerate(squares) if tile.value == 0)
+
+    return start, word, blank_mask
@@ -1,8 +1,12 @@
 """Module containing the definition for a Board object"""
 
+from time import perf_counter
 from .tile import Tile, TILES
-from .config import ALPHABET, SIZE
-from .utils import valid_word, tiles_to_str, copy_list
+from .config import ALPHABET, SIZE, DICTIONARY
+from .lexicon import Lexicon, mask_letters
+from .utils import valid_words, tiles_to_str
+from .events import EventEmitter, TILE_PLACED, TILE_REMOVED, BOARD_SET
+from .profiler import SearchStats
 
 TW = TILES["triple_word"]
 DW = TILES["double_word"]
@@ -13,6 +17,13 @@ ST = TILES["star"]
 EMPTY_TILES = [TW, DW, TL, DL, BA, ST]
 CENTER_COORDS = (7, 7)
 
+# Directions used to index segments, as (row step, column step)
+ACROSS = (0, 1)
+DOWN = (1, 0)
+
+# A word on the board as (first square, last square, direction)
+Span = tuple[tuple[int, int], tuple[int, int], tuple[int, int]]
+
 ORIGINAL_BOARD = [
     [TW, BA, BA, DL, BA, BA, BA, TW, BA, BA, BA, DL, BA, BA, TW],
     [BA, DW, BA, BA, BA, TL, BA, BA, BA, TL, BA, BA, BA, DW, BA],
@@ -31,22 +42,35 @@ ORIGINAL_BOARD = [
     [TW, BA, BA, DL, BA, BA, BA, TW, BA, BA, BA, DL, BA, BA, TW],
 ]
 
-CROSS_CHECKS_ACROSS = [[ALPHABET for _ in range(SIZE)] for _ in range(SIZE)]
-CROSS_CHECKS_DOWN = [[ALPHABET for _ in range(SIZE)] for _ in range(SIZE)]
 
-
-class Board:
+# suppress warning for too many attributes and public methods
+# pylint: disable=R0902,R0904
+class Board(EventEmitter):
     """
-    Class representing the Scrabble board
+    Class representing the Scrabble board, which publishes an event
+    whenever a tile is placed on or removed from a square
 
     Attributes:
         board (list(list(Tile))) : 2D list representing the board's current state
         current_turn_tiles (list(Tile)) : list containing all tiles placed this turn
+        lexicon (Lexicon) : the lexicon words are checked against, or None to use
+            the default dictionary
+        segments (dict(tuple(int, int), list(list(tuple(int, int))))) : run-length index
+            of occupied squares, mapping a direction to a grid holding the (start, end)
+            of the run covering each occupied square along that direction, or None
+        cross_checks_across (list(list(list(str)))) : letters that can be placed on
+            each square in an across play without forming an invalid down word
+        cross_checks_down (list(list(list(str)))) : letters that can be placed on
+            each square in a down play without forming an invalid across word
+        changed_squares (set(tuple(int, int))) : squares whose tile changed since
+            the last call to take_changed_squares, for redrawing only those squares
     """
 
-    def __init__(self):
+    def __init__(self, lexicon: Lexicon = None):
         """Initialize a Board object"""
+        super().__init__()
         self.current_turn_tiles: list[Tile] = []
+        self.lexicon: Lexicon = lexicon
 
         # 2D list to store the current board state
         self.board: list[list[Tile]] = [
@@ -67,6 +91,36 @@ class Board:
             [TW, BA, BA, DL, BA, BA, BA, TW, BA, BA, BA, DL, BA, BA, TW],
         ]
 
+        self.segments: dict[tuple[int, int], list[list[tuple[int, int]]]] = {}
+        self.rebuild_segments()
+
+        self.changed_squares: set[tuple[int, int]] = {
+            (row, col) for row in range(SIZE) for col in range(SIZE)
+        }
+
+        # Letters allowed on each square by the words crossing it
+        self.cross_checks_across: list[list[list[str]]] = [
+            [ALPHABET for _ in range(SIZE)] for _ in range(SIZE)
+        ]
+        self.cross_checks_down: list[list[list[str]]] = [
+            [ALPHABET for _ in range(SIZE)] for _ in range(SIZE)
+        ]
+
+    def get_lexicon(self) -> Lexicon:
+        """Getter function for the lexicon words are checked against"""
+        if self.lexicon is None:
+            return DICTIONARY.get()
+        return self.lexicon
+
+    def set_lexicon(self, lexicon: Lexicon):
+        """
+        Setter function for the lexicon, recomputing the cross-checks
+        for the tiles already on the board if it changed
+        """
+        if lexicon is not self.lexicon:
+            self.lexicon = lexicon
+            self.rebuild_cross_checks()
+
     def get_board(self) -> list[list[Tile]]:
         """Getter function for the current Board"""
         return self.board
@@ -78,13 +132,21 @@ class Board:
             for col in range(15):
                 self.board[row][col] = new_board[row][col]
 
+        self.rebuild_segments()
         self.clear_current_turn_tiles()
+        self.changed_squares.update(
+            (row, col) for row in range(SIZE) for col in range(SIZE)
+        )
+        self.emit(BOARD_SET, self)
 
     def update_tile(self, row: int, col: int, tile: Tile):
         """Sets the tile at the passed coordinates to the passed tile"""
         self.board[row][col] = tile
         tile.coords = (row, col)
         self.current_turn_tiles.append(tile)
+        self.join_segments(row, col)
+        self.changed_squares.add((row, col))
+        self.emit(TILE_PLACED, row, col)
 
     def remove_current_tile(self, tile: Tile):
         """Removes a given tile from the board and from current turn tiles"""
@@ -93,6 +155,15 @@ class Board:
 
         self.board[row][col] = ORIGINAL_BOARD[row][col]
         self.current_turn_tiles.remove(tile)
+        self.split_segments(row, col)
+        self.changed_squares.add((row, col))
+        self.emit(TILE_REMOVED, row, col)
+
+    def take_changed_squares(self) -> set[tuple[int, int]]:
+        """Returns the squares whose tile changed since the last call, and forgets them"""
+        changed = self.changed_squares
+        self.changed_squares = set()
+        return changed
 
     def clear_current_turn_tiles(self):
         """Clears the tiles placed this turn"""
@@ -129,11 +200,15 @@ class Board:
         return legal_turn, words_dict, is_bingo
 
     def test_turn(
-        self, move: list[tuple[Tile, tuple[int, int]]]
+        self, move: list[tuple[Tile, tuple[int, int]]], stats: SearchStats = None
     ) -> tuple[bool, dict[str, int]]:
-        """Performs the logic for testing if a turn is legal"""
-        backup_board = copy_list(self.board)
-
+        """
+        Performs the logic for testing if a turn is legal, counting the move
+        and timing it in stats if given
+        """
+        if stats is not None:
+            start = perf_counter()
+            stats.moves_tested += 1
         for tile in move:
             self.update_tile(tile[1][0], tile[1][1], tile[0])
 
@@ -142,39 +217,44 @@ class Board:
         words_dict: dict[str, int] = {}
         legal_turn = self.validate_turn(words)
         is_bingo = len(self.current_turn_tiles) >= 7
+        if stats is not None:
+            validated = perf_counter()
+            stats.validation_time += validated - start
 
         if legal_turn:
             words_dict = self.score_words(words)
-
-        self.board = backup_board
+            if stats is not None:
+                stats.scoring_time += perf_counter() - validated
 
         self.clear_current_turn_tiles()
 
         return legal_turn, words_dict, is_bingo
 
-    def score_words(self, words: list[list[Tile]]) -> dict[str, int]:
+    def score_words(self, words: list[Span]) -> dict[str, int]:
         """Returns a dict matching every word in words to its score"""
         words_dict: dict[str, int] = {}
+        placed = {tile.coords for tile in self.current_turn_tiles}
 
         for word in words:
-            words_dict[tiles_to_str(word)] = self.score_word(word)
+            words_dict[self.span_to_str(word)] = self.score_word(word, placed)
 
         return words_dict
 
-    def score_word(self, word: list[Tile]) -> int:
-        """Returns the score for a played word"""
+    def score_word(self, word: Span, placed: set[tuple[int, int]]) -> int:
+        """
+        Returns the score for a played word, where placed holds
+        the coordinates of every tile played this turn
+        """
         word_score = 0
         word_multiplier = 1
+        (row, col), _, (drow, dcol) = word
 
-        for tile in word:
-            row = tile.coords[0]
-            col = tile.coords[1]
-
+        for tile in self.span_tiles(word):
             letter_multiplier = 1
 
             letter_score = tile.value
 
-            if tile in self.current_turn_tiles:
+            if (row, col) in placed:
                 # If tile was played this turn, check for multipliers
                 board_location = ORIGINAL_BOARD[row][col]
 
@@ -188,6 +268,8 @@ class Board:
                     word_multiplier *= 3
 
             word_score += letter_score * letter_multiplier
+            row += drow
+            col += dcol
 
         return word_score * word_multiplier
 
@@ -195,205 +277,225 @@ class Board:
         """Returns the tile at the given coordinates"""
         return self.board[row][col]
 
-    def validate_turn(self, words) -> bool:
+    def validate_turn(self, words: list[Span]) -> bool:
         """Returns true if the played tiles makes a valid turn, otherwise False"""
+        if len(words) == 0:
+            return False
 
-        def find_center(
-            coords: tuple[int, int], visited: list[tuple[int, int]]
-        ) -> bool:
-            """
-            Searches the board using depth-first search to ensure that the tile
-            at the given coordinates can eventually trace back to the center tile
-            """
+        if not self.forms_connected_line():
+            return False
 
-            if coords == CENTER_COORDS:
-                return True
-            if coords in visited:
-                return False
-
-            visited.append(coords)
-            found = False
-            row = coords[0]
-            col = coords[1]
-
-            if (
-                -1 < row + 1 < len(self.board)
-                and -1 < col < len(self.board[0])
-                and self.get_tile_at(row + 1, col) not in EMPTY_TILES
-            ):
-                found = found or find_center((coords[0] + 1, coords[1]), visited)
-            if (
-                -1 < row - 1 < len(self.board)
-                and -1 < col < len(self.board[0])
-                and self.get_tile_at(row - 1, col) not in EMPTY_TILES
-            ):
-                found = found or find_center((coords[0] - 1, coords[1]), visited)
-            if (
-                -1 < row < len(self.board)
-                and -1 < col + 1 < len(self.board[0])
-                and self.get_tile_at(row, col + 1) not in EMPTY_TILES
-            ):
-                found = found or find_center((coords[0], coords[1] + 1), visited)
-            if (
-                -1 < row < len(self.board)
-                and -1 < col - 1 < len(self.board[0])
-                and self.get_tile_at(row, col - 1) not in EMPTY_TILES
-            ):
-                found = found or find_center((coords[0], coords[1] - 1), visited)
-
-            return found
-
-        words_are_valid = True
-        connects_to_center = True
-        forms_string = True
-
-        if len(self.current_turn_tiles) > 1:
-            coords = self.current_turn_tiles[0].coords
-            connects_to_center = find_center(coords, [])
-
-            if coords[0] - self.current_turn_tiles[1].coords[0] == 0:
-                word = (
-                    self.find_string(coords, 0, -1)[::-1]
-                    + self.find_string(coords, 0, 1)[1:]
-                )
-            else:
-                word = (
-                    self.find_string(coords, -1, 0)[::-1]
-                    + self.find_string(coords, 1, 0)[1:]
-                )
+        return all(
+            valid_words((self.span_to_str(word) for word in words), self.get_lexicon())
+        )
 
-            for tile in self.current_turn_tiles:
-                if tile not in word:
-                    forms_string = False
+    def forms_connected_line(self) -> bool:
+        """
+        Returns True if the tiles placed this turn lie in a single row or column
+        with no gaps between them, and touch either a previously played tile or
+        the center square
 
-        if len(words) == 0:
-            words_are_valid = False
+        Every previously played tile is already connected to the center, so touching
+        any of them is enough, and only the segments around the placed tiles
+        need to be checked
+        """
+        if len(self.current_turn_tiles) == 0:
+            return False
 
-        for word in words:
-            words_are_valid = words_are_valid and valid_word(tiles_to_str(word))
+        placed = {tile.coords for tile in self.current_turn_tiles}
+        rows = {coords[0] for coords in placed}
+        cols = {coords[1] for coords in placed}
 
-        return forms_string and connects_to_center and words_are_valid
+        if len(rows) > 1 and len(cols) > 1:
+            return False
 
-    def find_words(self) -> list[list[Tile]]:
-        """Finds all words created by the current turn"""
-        words: list[list[Tile]] = []
-        for tile in self.current_turn_tiles:
-            coords = tile.coords
+        direction = ACROSS if len(rows) == 1 else DOWN
+        other_direction = DOWN if direction == ACROSS else ACROSS
 
-            down_word: list[Tile] = (
-                self.find_string(coords, -1, 0)[::-1]
-                + self.find_string(coords, 1, 0)[1:]
-            )
-            across_word: list[Tile] = (
-                self.find_string(coords, 0, -1)[::-1]
-                + self.find_string(coords, 0, 1)[1:]
-            )
+        # The segment covering the first placed tile must reach the last one
+        line = self.find_span(min(placed), direction)
+        if max(placed) > line[1]:
+            return False
 
-            if len(down_word) > 1 and down_word not in words:
-                words.append(down_word)
-            if len(across_word) > 1 and across_word not in words:
-                words.append(across_word)
+        if CENTER_COORDS in placed or span_length(line) > len(placed):
+            return True
 
-        return words
+        for coords in placed:
+            if span_length(self.find_span(coords, other_direction)) > 1:
+                return True
 
-    def find_string(self, coords: tuple[int, int], drow: int, dcol: int) -> list[Tile]:
-        """
-        Searches the board in a specified direction, and
-        adds all tiles to a list until an empty tile is found
-        """
+        return False
 
-        row = coords[0]
-        col = coords[1]
-        letters: list[Tile] = []
-        tile = self.get_tile_at(row, col)
-        while not tile in EMPTY_TILES:
-            letters.append(tile)
-            row += drow
-            col += dcol
-            if -1 < row < len(self.board) and -1 < col < len(self.board[0]):
-                tile = self.get_tile_at(row, col)
-            else:
-                break
+    def is_empty(self, row: int, col: int) -> bool:
+        """Returns whether no letter has been placed at the given coordinates"""
+        return self.board[row][col] in EMPTY_TILES
 
-        return letters
+    def find_words(self) -> list[Span]:
+        """Finds the spans of all words created by the current turn"""
+        words: dict[Span, None] = {}
+        for tile in self.current_turn_tiles:
+            for direction in (DOWN, ACROSS):
+                span = self.find_span(tile.coords, direction)
+                if span[0] != span[1]:
+                    words[span] = None
+
+        return list(words)
+
+    def find_span(self, coords: tuple[int, int], direction: tuple[int, int]) -> Span:
+        """Returns the span of the occupied segment covering the given coordinates"""
+        row, col = coords
+        start, end = self.segments[direction][row][col]
+
+        if direction == ACROSS:
+            return (row, start), (row, end), direction
+        return (start, col), (end, col), direction
+
+    def span_tiles(self, span: Span) -> list[Tile]:
+        """Returns the tiles covered by a span"""
+        (start_row, start_col), (end_row, end_col), direction = span
+
+        if direction == ACROSS:
+            return self.board[start_row][start_col : end_col + 1]
+        return [self.board[row][start_col] for row in range(start_row, end_row + 1)]
+
+    def span_to_str(self, span: Span) -> str:
+        """Returns the string spelled by the tiles covered by a span"""
+        return tiles_to_str(self.span_tiles(span))
+
+    def rebuild_segments(self):
+        """Rebuilds the segment index from the current board state"""
+        self.segments = {
+            direction: [[None for _ in range(SIZE)] for _ in range(SIZE)]
+            for direction in (ACROSS, DOWN)
+        }
+
+        for row in range(SIZE):
+            for col in range(SIZE):
+                if not self.is_empty(row, col):
+                    self.join_segments(row, col)
+
+    def join_segments(self, row: int, col: int):
+        """Merges a newly occupied square with the segments on either side of it"""
+        for direction, grid in self.segments.items():
+            drow, dcol = direction
+            pos = row * drow + col * dcol
+
+            before = grid[row - drow][col - dcol] if pos > 0 else None
+            after = grid[row + drow][col + dcol] if pos < SIZE - 1 else None
+            start = before[0] if before else pos
+            end = after[1] if after else pos
+
+            for i in range(start - pos, end - pos + 1):
+                grid[row + i * drow][col + i * dcol] = (start, end)
+
+    def split_segments(self, row: int, col: int):
+        """Splits the segments covering a square that has just been emptied"""
+        for direction, grid in self.segments.items():
+            drow, dcol = direction
+            pos = row * drow + col * dcol
+
+            start, end = grid[row][col]
+            grid[row][col] = None
+
+            for i in range(start - pos, 0):
+                grid[row + i * drow][col + i * dcol] = (start, pos - 1)
+            for i in range(1, end - pos + 1):
+                grid[row + i * drow][col + i * dcol] = (pos + 1, end)
 
     def update_cross_checks(self):
-        """Updates the cross-check lists for whenever a move is played"""
+        """
+        Updates the cross-check sets for whenever a move is played, on every
+        square played and the empty squares at both ends of the row and column
+        segments through them, which are the only squares a move can change
+        """
+        squares: set[tuple[int, int]] = set()
+        for tile in self.get_current_turn_tiles():
+            squares.add(tile.coords)
+            for direction in (ACROSS, DOWN):
+                start, end, (drow, dcol) = self.find_span(tile.coords, direction)
+                squares.add((start[0] - drow, start[1] - dcol))
+                squares.add((end[0] + drow, end[1] + dcol))
 
-        self.update_cross_checks_letters()
-        self.update_cross_checks_words()
+        for row, col in squares:
+            if -1 < row < SIZE and -1 < col < SIZE:
+                self.update_cross_check(row, col)
 
-    def update_cross_checks_letters(self):
-        """Updates the cross-check lists parralel to every letter played"""
-        for tile in self.get_current_turn_tiles():
-            coords = tile.coords
+    def update_cross_check(self, row: int, col: int):
+        """
+        Recomputes the cross-check sets of a square from the tiles around it
+
+        Only the perpendicular words limit each square, since move generation
+        already checks the word formed along the line itself
+        """
+        if not self.is_empty(row, col):
+            self.cross_checks_across[row][col] = []
+            self.cross_checks_down[row][col] = []
+            return
+
+        # Column words limit across plays and row words limit down plays
+        for direction, cross_checks in (
+            (DOWN, self.cross_checks_across),
+            (ACROSS, self.cross_checks_down),
+        ):
+            if self.has_neighbour((row, col), direction):
+                cross_checks[row][col] = self.find_cross_check((row, col), direction)
+            else:
+                cross_checks[row][col] = ALPHABET
 
-            across = bool(
-                self.get_current_turn_tiles()[0].coords[0]
-                - self.get_current_turn_tiles()[-1].coords[0]
+    def find_cross_check(
+        self, coords: tuple[int, int], direction: tuple[int, int]
+    ) -> frozenset[str]:
+        """
+        Returns the letters that can be placed on an empty square without
+        forming an invalid word along the given direction
+        """
+        row, col = coords
+        drow, dcol = direction
+        before, after = "", ""
+
+        if (
+            row - drow > -1
+            and col - dcol > -1
+            and not self.is_empty(row - drow, col - dcol)
+        ):
+            before = self.span_to_str(
+                self.find_span((row - drow, col - dcol), direction)
+            )
+        if (
+            row + drow < SIZE
+            and col + dcol < SIZE
+            and not self.is_empty(row + drow, col + dcol)
+        ):
+            after = self.span_to_str(
+                self.find_span((row + drow, col + dcol), direction)
             )
 
-            if across:
-                CROSS_CHECKS_ACROSS[coords[0]][coords[1]] = []
-
-                if coords[0] - 1 > -1:
-                    CROSS_CHECKS_ACROSS[coords[0] - 1][coords[1]] = {
-                        letter
-                        for letter in ALPHABET
-                        if valid_word(
-                            letter + tiles_to_str(self.find_string(coords, 1, 0))[0]
-                        )
-                    }
-
-                if coords[0] + 1 < SIZE:
-                    CROSS_CHECKS_ACROSS[coords[0] + 1][coords[1]] = {
-                        letter
-                        for letter in ALPHABET
-                        if valid_word(
-                            tiles_to_str(self.find_string(coords, -1, 0))[::-1] + letter
-                        )
-                    }
-
-            if not across or len(self.get_current_turn_tiles()) == 1:
-                CROSS_CHECKS_DOWN[coords[0]][coords[1]] = []
-
-                if coords[1] - 1 > -1:
-                    CROSS_CHECKS_DOWN[coords[0]][coords[1] - 1] = {
-                        letter
-                        for letter in ALPHABET
-                        if valid_word(
-                            letter + tiles_to_str(self.find_string(coords, 0, 1))
-                        )
-                    }
-                if coords[1] + 1 < SIZE:
-                    CROSS_CHECKS_DOWN[coords[0]][coords[1] + 1] = {
-                        letter
-                        for letter in ALPHABET
-                        if valid_word(
-                            tiles_to_str(self.find_string(coords, 0, -1))[::-1] + letter
-                        )
-                    }
-
-    def update_cross_checks_words(self):
-        """Updates the cross-check lists perpendicular to every word played"""
-        words = self.find_words()
+        return mask_letters(self.get_lexicon().middle_hooks_of(before, after))
 
-        for word in words:
-            row, col = 0, 0
-            if word[1].coords[0] - word[0].coords[0] == 0:
-                across = True
-                row = word[1].coords[0]
-            else:
-                across = False
-                col = word[1].coords[1]
-
-            if across:
-                if word[0].coords[1] - 1 > -1:
-                    CROSS_CHECKS_ACROSS[row][word[0].coords[1] - 1] = []
-                if word[-1].coords[1] + 1 < SIZE:
-                    CROSS_CHECKS_ACROSS[row][word[-1].coords[1] + 1] = []
-            else:
-                if word[0].coords[0] - 1 > -1:
-                    CROSS_CHECKS_DOWN[word[0].coords[0] - 1][col] = []
-                if word[-1].coords[0] + 1 < SIZE:
-                    CROSS_CHECKS_DOWN[word[-1].coords[0] + 1][col] = []
+    def rebuild_cross_checks(self):
+        """
+        Recomputes every cross-check set from the tiles on the board, giving
+        the same sets as updating them after each move
+        """
+        for row in range(SIZE):
+            for col in range(SIZE):
+                self.update_cross_check(row, col)
+
+    def has_neighbour(
+        self, coords: tuple[int, int], direction: tuple[int, int]
+    ) -> bool:
+        """Returns whether a square has an occupied square beside it along a direction"""
+        row, col = coords
+        drow, dcol = direction
+
+        for nrow, ncol in ((row - drow, col - dcol), (row + drow, col + dcol)):
+            if -1 < nrow < SIZE and -1 < ncol < SIZE and not self.is_empty(nrow, ncol):
+                return True
+
+        return False
+
+
+def span_length(span: Span) -> int:
+    """Returns the number of squares covered by a span"""
+    (start_row, start_col), (end_row, end_col), _ = span
+    return end_row - start_row + end_col - start_col + 1
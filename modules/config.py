@@ -1,7 +1,7 @@
 """Module containing several config values for various modules"""
 
 import arcade
-import pygtrie
+from .lexicon import LexiconLoader, LexiconRegistry
 
 WINDOW_WIDTH, WINDOW_HEIGHT = arcade.get_display_size()
 WINDOW_TITLE = "Scrabble"
@@ -36,25 +36,6 @@ BACKGROUND_COORDS: dict[str, tuple[float, float]] = {
     "rack": RACK_BACKGROUND,
 }
 
-LETTER_DIST = "\
-A - 9     J - 1     S - 4  \
---------------------------- \
-    B - 2     K - 1     T - 6 \
---------------------------- \
-    C - 2     L - 4     U - 4 \
---------------------------- \
-    D - 4     M - 2     V - 2 \
---------------------------- \
-    E - 12    N - 6     W - 2 \
---------------------------- \
-    F - 2     O - 8     X - 1 \
---------------------------- \
-    G - 3     P - 2     Y - 2 \
---------------------------- \
-    H - 2     Q - 1     Z - 1 \
---------------------------- \
-    I - 9   R - 6   Blank - 2"
-
 ALPHABET = {
     "a",
     "b",
@@ -84,10 +65,20 @@ ALPHABET = {
     "z",
 }
 
-DICTIONARY = pygtrie.CharTrie()
-with open("./assets/dictionary.csv", "r", encoding="utf-8") as file:
-    for line in file:
-        DICTIONARY[line.strip()] = True
+# Word lists that games can choose between, compiled once into the cache directory
+LEXICONS = {"default": "./assets/dictionary.csv"}
+LEXICON_CACHE_DIR = "./assets/cache"
+LEXICON_MEMORY_LIMIT = 256 * 1024 * 1024
+LEXICON_REGISTRY = LexiconRegistry(LEXICONS, LEXICON_CACHE_DIR, LEXICON_MEMORY_LIMIT)
+
+# The default dictionary is loaded on first use, or in the background once started
+DICTIONARY = LexiconLoader(LEXICON_REGISTRY, "default")
+
+# Downscaled copies of the backgrounds shown in the settings popup
+THUMBNAIL_CACHE_DIR = "./assets/cache/thumbnails"
+
+# Where the profiling overlay exports its samples
+PROFILE_EXPORT_DIR = "./profiles"
 
 BACKGROUNDS = {
             "gray": "./assets/images/gray.png",
@@ -1,68 +1,148 @@
 """Module containing the definition for a Drawbag object"""
 
-from random import shuffle
-from .tile import Tile, TILES
+import random
+from .tile import Tile, TILES, SLOT_KEYS, tile_slot, slot_tile
+
+# The number of each tile in a full draw bag
+TILE_COUNTS = {
+    "a": 9,
+    "b": 2,
+    "c": 2,
+    "d": 4,
+    "e": 12,
+    "f": 2,
+    "g": 3,
+    "h": 2,
+    "i": 9,
+    "j": 1,
+    "k": 1,
+    "l": 4,
+    "m": 2,
+    "n": 6,
+    "o": 8,
+    "p": 2,
+    "q": 1,
+    "r": 6,
+    "s": 4,
+    "t": 6,
+    "u": 4,
+    "v": 2,
+    "w": 2,
+    "x": 1,
+    "y": 2,
+    "z": 1,
+    "blank": 2,
+}
 
 
 class Drawbag:
     """
     Class representing the draw bag
 
+    The bag only counts its tiles, creating a Tile when one is drawn
+
     Attributes:
-        drawbag (list(Tile)): A list containing the tiles in the draw bag
+        counts (list(int)): The number of tiles of each letter in the draw bag,
+            indexed by count slot with blanks in the last slot
+        size (int): The total number of tiles in the draw bag
+        rng (random.Random): The random number generator tiles are drawn with
+        seeds (random.Random): The generator that seeds the generators of copies
+            and samplers, seeded once from rng so deriving them never moves rng
+        pool (list(int)): The count slot of every tile in the draw bag, built
+            for sampling and None whenever the bag has changed since
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
         """Initializes a draw bag object"""
-        self.drawbag: list[Tile] = []
+        self.counts: list[int] = [0] * len(SLOT_KEYS)
+        self.size: int = 0
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        self.seeds: random.Random = random.Random(self.rng.getrandbits(64))
+        self.pool: list[int] = None
         self.initialize_drawbag()
 
-    def add_tile(self, tile: Tile, quantity: int):
+    def add_tile(self, tile: Tile, quantity: int = 1):
         """Function to add a tile to the draw bag"""
-        for _ in range(quantity):
-            self.drawbag.append(Tile.copy(tile))
+        self.counts[tile_slot(tile)] += quantity
+        self.size += quantity
+        self.pool = None
 
     def initialize_drawbag(self):
         """Function to initialize the draw bag with the proper letter distribution"""
-        self.add_tile(TILES["a"], 9)
-        self.add_tile(TILES["b"], 2)
-        self.add_tile(TILES["c"], 2)
-        self.add_tile(TILES["d"], 4)
-        self.add_tile(TILES["e"], 12)
-        self.add_tile(TILES["f"], 2)
-        self.add_tile(TILES["g"], 3)
-        self.add_tile(TILES["h"], 2)
-        self.add_tile(TILES["i"], 9)
-        self.add_tile(TILES["j"], 1)
-        self.add_tile(TILES["k"], 1)
-        self.add_tile(TILES["l"], 4)
-        self.add_tile(TILES["m"], 2)
-        self.add_tile(TILES["n"], 6)
-        self.add_tile(TILES["o"], 8)
-        self.add_tile(TILES["p"], 2)
-        self.add_tile(TILES["q"], 1)
-        self.add_tile(TILES["r"], 6)
-        self.add_tile(TILES["s"], 4)
-        self.add_tile(TILES["t"], 6)
-        self.add_tile(TILES["u"], 4)
-        self.add_tile(TILES["v"], 2)
-        self.add_tile(TILES["w"], 2)
-        self.add_tile(TILES["x"], 1)
-        self.add_tile(TILES["y"], 2)
-        self.add_tile(TILES["z"], 1)
-        self.add_tile(TILES["blank"], 2)
-        shuffle(self.drawbag)
+        for key, quantity in TILE_COUNTS.items():
+            self.add_tile(TILES[key], quantity)
 
     def draw_tile(self) -> Tile | None:
         """Function to simulate drawing a tile from the draw bag"""
         if not self.is_empty():
-            return self.drawbag.pop()
+            return slot_tile(self.draw_slot())
         return None
 
+    def draw_slot(self) -> int:
+        """Removes a random tile from the draw bag, returning its count slot"""
+        pick = self.rng.randrange(self.size)
+
+        for slot, count in enumerate(self.counts):
+            if pick < count:
+                self.counts[slot] -= 1
+                self.size -= 1
+                self.pool = None
+                return slot
+            pick -= count
+
+        raise IndexError("draw from an empty draw bag")
+
+    def sample(self, k: int, rng: random.Random = None) -> list[int]:
+        """
+        Returns the count slots of k random tiles from the draw bag, or of every
+        tile if it holds fewer, without removing them
+
+        Draws use the bag's own generator unless another is passed, so
+        simulations can sample from one bag independently
+        """
+        if self.pool is None:
+            self.pool = [
+                slot for slot, count in enumerate(self.counts) for _ in range(count)
+            ]
+
+        return (rng or self.rng).sample(self.pool, min(k, self.size))
+
+    def copy(self, rng: random.Random = None):
+        """
+        Returns an independent draw bag holding the same tiles, of the same class,
+        drawing with the given generator or otherwise one derived from this bag's
+        """
+        drawbag = type(self).__new__(type(self))
+        drawbag.counts = self.counts[:]
+        drawbag.size = self.size
+        drawbag.rng = rng if rng is not None else self.derive_rng()
+        drawbag.seeds = self.derive_rng()
+        drawbag.pool = self.pool
+        return drawbag
+
+    def derive_rng(self) -> random.Random:
+        """
+        Returns a new generator for a copy or sampler of the bag, so whatever
+        draws from it never moves the bag's generator or any other derived one
+        """
+        return random.Random(self.seeds.getrandbits(64))
+
+    def get_rng(self) -> random.Random:
+        """Getter function for the random number generator"""
+        return self.rng
+
+    def get_counts(self) -> list[int]:
+        """Getter function for the number of tiles in each count slot"""
+        return self.counts
+
+    def key(self) -> bytes:
+        """Returns the tiles in the draw bag as bytes, for use as a cache key"""
+        return bytes(self.counts)
+
     def get_remaining_tiles(self) -> int:
         """Function to get the amount of tiles remaining in the draw bag"""
-        return len(self.drawbag)
+        return self.size
 
     def is_empty(self) -> bool:
         """Returns whether or not a the drawbag is empty"""
-        return len(self.drawbag) == 0
+        return self.size == 0
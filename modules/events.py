@@ -0,0 +1,48 @@
+"""Module containing the definition for an EventEmitter object and the events of the game"""
+
+from typing import Any, Callable
+
+# Board events, published with the row and column of the square
+TILE_PLACED = "tile_placed"
+TILE_REMOVED = "tile_removed"
+BOARD_SET = "board_set"
+
+# Rack events, published with the rack
+RACK_CHANGED = "rack_changed"
+RACK_REORDERED = "rack_reordered"
+
+# Player events, published with the player
+SCORE_CHANGED = "score_changed"
+
+# Game events, published with the game manager
+TURN_ADVANCED = "turn_advanced"
+BAG_CHANGED = "bag_changed"
+
+
+class EventEmitter:
+    """
+    Class which lets other objects subscribe to the changes of an object,
+    so they can update only what depends on the part that changed
+
+    Attributes:
+        listeners (dict(str, list(Callable))): The functions subscribed to each event
+    """
+
+    def __init__(self):
+        self.listeners: dict[str, list[Callable[..., None]]] = {}
+
+    def subscribe(self, event: str, listener: Callable[..., None]):
+        """Calls a function with the event's arguments whenever an event is published"""
+        self.listeners.setdefault(event, []).append(listener)
+
+    def unsubscribe(self, event: str, listener: Callable[..., None]):
+        """Stops calling a function for an event"""
+        if listener in self.listeners.get(event, []):
+            self.listeners[event].remove(listener)
+
+    def emit(self, event: str, *args: Any):
+        """Publishes an event to every function subscribed to it"""
+        listeners = self.listeners.get(event)
+        if listeners:
+            for listener in listeners:
+                listener(*args)
@@ -1,27 +1,54 @@
 """Module containing the definition for a GameManager object"""
 
 import random
+from .config import LEXICON_REGISTRY
+from .lexicon import Lexicon
 from .board import Board
 from .drawbag import Drawbag
 from .player import Player
 from .ai import AI
+from .opening_book import get_opening_book
+from .tile import Tile, tile_slot
+from .events import EventEmitter, TURN_ADVANCED, BAG_CHANGED
 
 
-class GameManager:
+# suppress warning for too many attributes
+# pylint: disable=R0902
+class GameManager(EventEmitter):
     """
-    Class which contains several methods for controlling scrabble game flow
+    Class which contains several methods for controlling scrabble game flow,
+    and publishes an event when the turn advances or the draw bag changes
 
     Attributes:
         player_list (list(Player)): The game's list of players
         board (Board): The game's board state
         drawbag (Drawbag): The game's drawbag
         turn (int): The current turn, as an index of player_list
+        lexicon_id (str): Identifier of the word list this game is played with
+        lexicon (Lexicon): The compiled word list this game is played with
+        seed (int): The seed of the game's random number generator, None for a
+            random seed
+        rng (random.Random): The random number generator for all of the game's
+            chance, so a seed replays the same game
+        shuffle_rng (random.Random): The generator racks are shuffled with, derived
+            from the draw bag's so shuffling never changes the tiles drawn
     """
 
-    def __init__(self, players: list[tuple[str, str] | tuple[str, str, int]]):
+    def __init__(
+        self,
+        players: list[tuple[str, str] | tuple[str, str, int]],
+        lexicon_id: str = "default",
+        seed: int = None,
+    ):
         """Creates a GameManager object"""
-        self.board: Board = Board()
-        self.drawbag: Drawbag = Drawbag()
+        super().__init__()
+        self.seed: int = seed
+        self.rng: random.Random = random.Random(seed)
+        self.lexicon_id: str = lexicon_id
+        self.lexicon: Lexicon = LEXICON_REGISTRY.get(lexicon_id)
+        self.board: Board = Board(self.lexicon)
+        self.drawbag: Drawbag = Drawbag(self.rng)
+        self.shuffle_rng: random.Random = self.drawbag.derive_rng()
         self.turn: int = -1
 
         self.player_list: list[Player] = []
@@ -38,11 +65,95 @@ class GameManager:
 
     def initialize_game(self):
         """Starts the scrabble game by choosing a random player to act first"""
-        self.turn = random.randint(0, len(self.player_list) - 1)
+        self.turn = self.rng.randint(0, len(self.player_list) - 1)
 
     def next_turn(self):
         """Switches the turn to the next player in rotation"""
         self.turn = (self.turn + 1) % len(self.player_list)
+        self.refresh_lexicon()
+        self.emit(TURN_ADVANCED, self)
+
+    def reload_lexicon(self):
+        """
+        Starts reloading the game's word list in the background, which the game
+        switches to at the start of the first turn after it is ready
+        """
+        LEXICON_REGISTRY.reload(self.lexicon_id)
+
+    def refresh_lexicon(self):
+        """
+        Switches to the newest version of the game's lexicon if it was reloaded,
+        which only happens between turns so a turn never sees two word lists
+        """
+        latest = LEXICON_REGISTRY.peek(self.lexicon_id)
+        if latest is not None and latest is not self.lexicon:
+            self.lexicon = latest
+            self.board.set_lexicon(latest)
+
+    def play_turn(self) -> tuple[bool, dict[str, int], bool]:
+        """
+        Plays the tiles the current player placed this turn, and lets every
+        other player see them if the turn is legal
+        """
+        placed = list(self.board.get_current_turn_tiles())
+        legal_turn, words, is_bingo = self.board.play_turn()
+
+        if legal_turn:
+            player = self.get_current_turn_player()
+            player.set_last_play([tile_slot(tile) for tile in placed])
+            for other in self.player_list:
+                if other is not player:
+                    other.get_unseen().see_tiles(placed)
+
+        return legal_turn, words, is_bingo
+
+    def trade_tiles(self, tiles: list[Tile]):
+        """
+        Refills the current player's rack and puts the tiles they traded in
+        back into the draw bag
+        """
+        player = self.get_current_turn_player()
+        player.refill_rack(self.drawbag)
+
+        for tile in tiles:
+            self.drawbag.add_tile(tile)
+        player.get_unseen().return_tiles(tiles)
+        player.set_last_play([])
+        self.emit(BAG_CHANGED, self)
+
+    def refill_rack(self):
+        """Refills the current player's rack from the draw bag"""
+        self.get_current_turn_player().refill_rack(self.drawbag)
+        self.emit(BAG_CHANGED, self)
+
+    def is_stuck(self, searched: Player = None) -> bool:
+        """
+        Returns whether a game between AI players cannot continue because none
+        of them can place a legal word, since they never trade to draw new tiles
+
+        searched is a player whose search just found no move on the current board,
+        so neither their rack nor an identical one is searched again
+
+        A game with a human player is never stuck, as a search is not trusted to
+        end the game for a human's rack, so those games rely on the skip count
+        """
+        if not all(isinstance(player, AI) for player in self.player_list):
+            return False
+
+        searcher = self.player_list[0]
+        searched_racks: set[bytes] = set()
+        if searched is not None:
+            searched_racks.add(searched.get_rack().key())
+
+        for player in self.player_list:
+            key = player.get_rack().key()
+            if key in searched_racks:
+                continue
+            if searcher.has_legal_move(player.get_rack()):
+                return False
+            searched_racks.add(key)
+
+        return True
 
     def get_current_turn(self) -> int:
         """Getter function for the current turn as an integer"""
@@ -52,6 +163,18 @@ class GameManager:
         """Getter function for the current turn as a Player"""
         return self.player_list[self.turn]
 
+    def get_lexicon(self) -> Lexicon:
+        """Getter function for the game's lexicon"""
+        return self.lexicon
+
+    def get_rng(self) -> random.Random:
+        """Getter function for the game's random number generator"""
+        return self.rng
+
+    def get_shuffle_rng(self) -> random.Random:
+        """Getter function for the generator racks are shuffled with"""
+        return self.shuffle_rng
+
     def get_drawbag(self) -> Drawbag:
         """Getter function for the drawbag"""
         return self.drawbag
@@ -71,9 +194,9 @@ class GameManager:
         emptied_players: list[Player] = []
 
         for player in self.player_list:
-            for tile in player.get_rack_tiles():
-                player.add_score(-tile.get_value())
-                unplayed_value += tile.get_value()
+            rack_value = player.get_rack().get_value()
+            player.add_score(-rack_value)
+            unplayed_value += rack_value
             if player.rack_is_empty():
                 emptied_players.append(player)
 
@@ -82,4 +205,7 @@ class GameManager:
 
         scores = {player.get_name(): player.get_score() for player in self.player_list}
 
+        # first moves found this game are written out now rather than after each one
+        get_opening_book(self.board.get_lexicon()).save()
+
         return scores
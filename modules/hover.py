@@ -0,0 +1,47 @@
+"""Module containing the definition for a HoverState object"""
+
+from typing import Any, Callable
+
+
+class HoverState:
+    """
+    Class which remembers the element under the mouse, so that hover effects
+    are only applied when the mouse enters or leaves an element instead of
+    on every mouse movement
+
+    Attributes:
+        hovered (Any): The element currently under the mouse, None if there is none
+        on_enter (Callable): Called with an element when the mouse enters it
+        on_leave (Callable): Called with an element when the mouse leaves it
+    """
+
+    def __init__(
+        self, on_enter: Callable[[Any], None], on_leave: Callable[[Any], None]
+    ):
+        self.hovered: Any = None
+        self.on_enter: Callable[[Any], None] = on_enter
+        self.on_leave: Callable[[Any], None] = on_leave
+
+    def set_hovered(self, element: Any) -> bool:
+        """Moves the hover to an element, returning whether the hovered element changed"""
+        if element == self.hovered:
+            return False
+
+        if self.hovered is not None:
+            self.on_leave(self.hovered)
+        self.hovered = element
+        if element is not None:
+            self.on_enter(element)
+        return True
+
+    def get_hovered(self) -> Any:
+        """Getter function for the hovered element"""
+        return self.hovered
+
+    def clear(self):
+        """Leaves the hovered element"""
+        self.set_hovered(None)
+
+    def forget(self):
+        """Forgets the hovered element without leaving it, for when it has been redrawn"""
+        self.hovered = None
@@ -0,0 +1,1075 @@
+"""Module containing the definitions for Lexicon and LexiconLoader objects"""
+
+import copy
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+
+def letter_mask(letters) -> int:
+    """Returns a bitmask with one bit set for every letter in letters"""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (ord(letter) - 97)
+    return mask
+
+
+ALL_LETTERS = (1 << 26) - 1
+EMPTY_SQUARE = "?"
+
+# Serialized lexicons start with a magic string, then the word count, the node
+# counts of both tries, the length of the word list in bytes and the number of
+# slots in the word table
+LEXICON_HEADER = struct.Struct("<4sIIIII")
+LEXICON_MAGIC = b"LEX2"
+
+MASK_LETTERS: dict[int, frozenset[str]] = {}
+
+
+def mask_letters(mask: int) -> frozenset[str]:
+    """Returns the set of letters whose bits are set in mask"""
+    if mask not in MASK_LETTERS:
+        MASK_LETTERS[mask] = frozenset(
+            chr(97 + i) for i in range(26) if mask & (1 << i)
+        )
+    return MASK_LETTERS[mask]
+
+
+def compile_trie(words: list[str]) -> tuple[array, str, bytearray, array]:
+    """
+    Flattens a trie of the given words into arrays
+
+    Returns:
+        the first edge of every node, the letter on every edge, whether every node
+        ends a word, and the mask of letters ending a word one step below every node
+    """
+    prefixes = {""}
+    for word in words:
+        prefixes.update([word[:i] for i in range(1, len(word) + 1)])
+
+    # Sorting alphabetically and then stably by length gives breadth-first order
+    nodes = sorted(prefixes)
+    nodes.sort(key=len)
+    node_ids = {prefix: i for i, prefix in enumerate(nodes)}
+    ends = set(words)
+
+    child_counts = [0] * (len(nodes) + 1)
+    terminal = bytearray(len(nodes))
+    hooks = array("I", bytes(4 * len(nodes)))
+
+    for i, prefix in enumerate(nodes):
+        if i == 0:
+            continue
+
+        parent = node_ids[prefix[:-1]]
+        child_counts[parent + 1] += 1
+
+        if prefix in ends:
+            terminal[i] = 1
+            hooks[parent] |= 1 << (ord(prefix[-1]) - 97)
+
+    first_edge = array("I", child_counts)
+    for i in range(1, len(first_edge)):
+        first_edge[i] += first_edge[i - 1]
+
+    labels = "".join(prefix[-1] for prefix in nodes[1:])
+
+    return first_edge, labels, terminal, hooks
+
+
+def compile_word_table(words: list[str]) -> tuple[bytes, array, array]:
+    """
+    Joins the words into a blob and hashes them into an open addressing table,
+    so a word can be looked up in the blob without building any str objects
+
+    Returns:
+        the words joined by newlines, the offset of every word in the blob followed
+        by one past the end of the blob, and a table at most half full holding one
+        more than the index of a word in each used slot and 0 in each empty slot
+    """
+    blob = "\n".join(words).encode("ascii")
+    offsets = array("I", bytes(4 * (len(words) + 1)))
+    for i, word in enumerate(words):
+        offsets[i + 1] = offsets[i] + len(word) + 1
+
+    table = array("I", bytes(4 << (2 * len(words)).bit_length()))
+    mask = len(table) - 1
+    view = memoryview(blob)
+    for i in range(len(words)):
+        slot = zlib.crc32(view[offsets[i] : offsets[i + 1] - 1]) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = i + 1
+
+    return blob, offsets, table
+
+
+# suppress warning for too many attributes and public methods
+# pylint: disable=R0902,R0904
+class Lexicon:
+    """
+    Class representing a compiled word list
+
+    The words are stored in a trie flattened into arrays. Nodes are numbered in
+    breadth-first order, so the children of a node are contiguous and every edge
+    leads to the node numbered one past the edge
+
+    A lexicon can be serialized into a single buffer and rebuilt on top of it
+    without copying the arrays, so processes can share one read-only copy
+
+    A patched lexicon shares the arrays of its base lexicon and keeps the words
+    inserted and deleted since in an overlay, which every lookup checks before
+    the base, until the word list is compiled again in full. The arrays
+    themselves only ever describe the base
+
+    Attributes:
+        words (list(str)): Every word in the lexicon, in sorted order, decoded from
+            word_blob the first time it is needed
+        word_blob (memoryview): The words joined by newlines
+        word_offsets (array(int)): The offset of each word in word_blob, followed
+            by one past the end of word_blob
+        word_table (array(int)): Open addressing table of the words hashed by the
+            CRC-32 of their letters, holding one more than each word's index, so
+            membership tests probe the shared buffer instead of a set of strings
+        word_masks (array(int)): Bitmask of the letters used by each word in words
+        first_edge (array(int)): Index of the first outgoing edge of each node, the
+            edges of node n being first_edge[n] up to first_edge[n + 1]
+        labels (str): The letter on each edge, edge e leading to node e + 1
+        terminal (bytearray): 1 for every node that ends a word, otherwise 0
+        back_hooks (array(int)): For each node, a mask of the letters that
+            complete a word when added after the node's prefix
+        reverse_first_edge (array(int)): first_edge for a trie of every word reversed
+        reverse_labels (str): labels for the trie of every word reversed
+        front_hooks (array(int)): For each node of the reversed trie, a mask of the
+            letters that complete a word when added before the node's fragment
+        backing (SharedMemory | mmap): The shared memory block or memory-mapped
+            file holding the arrays of a lexicon rebuilt from a buffer, if any
+        digest (str): The hash of the word list the lexicon was compiled from,
+            set when it is loaded through a LexiconRegistry, otherwise None
+        base (Lexicon): The lexicon whose arrays a patched lexicon shares, otherwise None
+        overlay (Lexicon): The words inserted into a patched lexicon, or None if none were
+        deleted (frozenset(str)): The base words deleted from a patched lexicon
+    """
+
+    def __init__(self, words, progress=None):
+        """
+        Compiles a lexicon from an iterable of lowercase words, calling
+        progress with the fraction of the work done after each stage
+        """
+        self._words: list[str] = sorted(set(words))
+        blob, self.word_offsets, self.word_table = compile_word_table(self.words)
+        self.word_blob: memoryview = memoryview(blob)
+        self.backing: shared_memory.SharedMemory | mmap.mmap = None
+        self.digest: str = None
+        self.base: Lexicon = None
+        self.overlay: Lexicon = None
+        self.deleted: frozenset[str] = frozenset()
+        self.word_masks: array = array("I", (letter_mask(word) for word in self.words))
+        if progress:
+            progress(0.3)
+
+        self.first_edge, self.labels, self.terminal, self.back_hooks = compile_trie(
+            self.words
+        )
+        if progress:
+            progress(0.65)
+
+        self.reverse_first_edge, self.reverse_labels, _, self.front_hooks = (
+            compile_trie([word[::-1] for word in self.words])
+        )
+        if progress:
+            progress(1.0)
+
+    @classmethod
+    def from_file(cls, path: str, progress=None):
+        """Compiles a lexicon from a file containing one word per line"""
+        return cls(read_words(path, progress), progress)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """
+        Rebuilds a lexicon serialized by to_bytes on top of buffer
+
+        Every array is a view into the buffer, so only the edge labels are copied
+        """
+        # the header is copied out first, so a rejected buffer is left without views
+        # into it and can still be closed
+        header = bytes(memoryview(buffer)[: LEXICON_HEADER.size])
+        if len(header) < LEXICON_HEADER.size:
+            raise ValueError("buffer does not contain a serialized lexicon")
+
+        magic, n_words, n_nodes, n_reverse_nodes, blob_length, n_slots = (
+            LEXICON_HEADER.unpack(header)
+        )
+        if magic != LEXICON_MAGIC:
+            raise ValueError("buffer does not contain a serialized lexicon")
+
+        view = memoryview(buffer)
+
+        sections = [
+            4 * n_words,
+            4 * (n_nodes + 1),
+            4 * n_nodes,
+            4 * (n_reverse_nodes + 1),
+            4 * n_reverse_nodes,
+            4 * (n_words + 1),
+            4 * n_slots,
+            n_nodes,
+            n_nodes - 1,
+            n_reverse_nodes - 1,
+            blob_length,
+        ]
+        views = []
+        offset = LEXICON_HEADER.size
+        for length in sections:
+            views.append(view[offset : offset + length])
+            offset += length
+
+        lexicon = cls.__new__(cls)
+        lexicon._words = None
+        lexicon.backing = None
+        lexicon.digest = None
+        lexicon.base = None
+        lexicon.overlay = None
+        lexicon.deleted = frozenset()
+        (
+            lexicon.word_masks,
+            lexicon.first_edge,
+            lexicon.back_hooks,
+            lexicon.reverse_first_edge,
+            lexicon.front_hooks,
+            lexicon.word_offsets,
+            lexicon.word_table,
+        ) = (section.cast("I") for section in views[:7])
+        lexicon.terminal = views[7]
+        lexicon.labels = str(views[8], "ascii")
+        lexicon.reverse_labels = str(views[9], "ascii")
+        lexicon.word_blob = views[10]
+
+        return lexicon
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the lexicon into a single buffer readable by from_buffer,
+        compiling a patched lexicon's words again in full first
+        """
+        if self.base is not None:
+            return Lexicon(self.words).to_bytes()
+
+        header = LEXICON_HEADER.pack(
+            LEXICON_MAGIC,
+            len(self),
+            len(self.terminal),
+            len(self.front_hooks),
+            self.word_blob.nbytes,
+            len(self.word_table),
+        )
+
+        return b"".join(
+            [
+                header,
+                bytes(self.word_masks),
+                bytes(self.first_edge),
+                bytes(self.back_hooks),
+                bytes(self.reverse_first_edge),
+                bytes(self.front_hooks),
+                bytes(self.word_offsets),
+                bytes(self.word_table),
+                bytes(self.terminal),
+                self.labels.encode("ascii"),
+                self.reverse_labels.encode("ascii"),
+                bytes(self.word_blob),
+            ]
+        )
+
+    def share(self) -> shared_memory.SharedMemory:
+        """
+        Copies the serialized lexicon into a new shared memory block, which
+        worker processes can open with attach using the block's name
+
+        The caller owns the block, and should close and unlink it once every
+        worker is done with it
+        """
+        data = self.to_bytes()
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[: len(data)] = data
+        return block
+
+    @classmethod
+    def attach(cls, name: str):
+        """Opens a lexicon shared by another process through share"""
+        block = shared_memory.SharedMemory(name=name)
+        lexicon = cls.from_buffer(block.buf)
+        lexicon.backing = block
+        return lexicon
+
+    def save(self, path: str):
+        """Writes the serialized lexicon to a file, replacing it atomically"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(self.to_bytes())
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Opens a lexicon written by save by memory-mapping the file, so every
+        process loading the same file shares its pages
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            lexicon = cls.from_buffer(mapping)
+        except ValueError:
+            mapping.close()
+            raise
+
+        lexicon.backing = mapping
+        return lexicon
+
+    def nbytes(self) -> int:
+        """Returns the approximate memory used by the lexicon's data"""
+        if self.base is not None:
+            total = self.base.nbytes() + sys.getsizeof(self.deleted)
+            if self.overlay is not None:
+                total += self.overlay.nbytes()
+            return total
+
+        arrays = (
+            self.word_masks,
+            self.first_edge,
+            self.back_hooks,
+            self.reverse_first_edge,
+            self.front_hooks,
+            self.word_offsets,
+            self.word_table,
+            self.terminal,
+            self.word_blob,
+        )
+        total = sum(memoryview(data).nbytes for data in arrays)
+        total += len(self.labels) + len(self.reverse_labels)
+
+        # every str object carries its own header, which dwarfs the letters of short words
+        if self._words is not None:
+            total += sys.getsizeof(self._words)
+            total += sum(sys.getsizeof(word) for word in self._words)
+
+        return total
+
+    def close(self):
+        """Releases the views into the buffer backing the lexicon and closes it"""
+        if self.backing is None:
+            return
+
+        for view in (
+            self.word_masks,
+            self.first_edge,
+            self.back_hooks,
+            self.reverse_first_edge,
+            self.front_hooks,
+            self.word_offsets,
+            self.word_table,
+            self.terminal,
+            self.word_blob,
+        ):
+            view.release()
+
+        self.backing.close()
+        self.backing = None
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def words(self) -> list[str]:
+        """Getter function for the sorted list of words"""
+        if self._words is None:
+            if self.base is not None:
+                words = [word for word in self.base.words if word not in self.deleted]
+                if self.overlay is not None:
+                    words = sorted(words + self.overlay.words)
+                self._words = words
+            else:
+                blob = str(self.word_blob, "ascii")
+                self._words = blob.split("\n") if blob else []
+        return self._words
+
+    def __len__(self) -> int:
+        if self.base is not None:
+            overlay_length = len(self.overlay) if self.overlay is not None else 0
+            return len(self.base) - len(self.deleted) + overlay_length
+        return len(self.word_masks)
+
+    def diff(self, words) -> tuple[list[str], list[str]]:
+        """Returns the words to insert and the words to delete to reach the given words"""
+        new_words = set(words)
+        inserted = sorted(word for word in new_words if not self.is_word(word))
+        deleted = [word for word in self.words if word not in new_words]
+        return inserted, deleted
+
+    def patched(self, inserted: list[str], deleted: list[str]):
+        """
+        Returns a new lexicon with words inserted and deleted, leaving this one
+        unchanged for anything still reading it
+
+        Only the inserted words are compiled, into the overlay of a lexicon sharing
+        the base arrays, so a small change is ready long before a full compile
+        """
+        inserted = set(inserted)
+        deleted = set(deleted)
+        base = self.base if self.base is not None else self
+        overlay_words = set(self.overlay.words) if self.overlay is not None else set()
+
+        # inserting a deleted base word restores it, and deleting an inserted word
+        # takes it back out of the overlay
+        base_deleted = (self.deleted - inserted) | (deleted - overlay_words)
+        overlay_words = (overlay_words - deleted) | (inserted - self.deleted)
+
+        lexicon = copy.copy(base)
+        # suppress warning for clearing the copy's decoded words
+        # pylint: disable=W0212
+        lexicon._words = None
+        lexicon.backing = None
+        lexicon.digest = None
+        lexicon.base = base
+        lexicon.overlay = Lexicon(overlay_words) if overlay_words else None
+        lexicon.deleted = frozenset(base_deleted)
+        return lexicon
+
+    def patch_hooks(self, mask: int, before: str, after: str) -> int:
+        """
+        Corrects a mask of the letters forming a base word between before and after
+        for the words inserted into and deleted from a patched lexicon
+        """
+        if self.deleted:
+            for i in range(26):
+                if mask & (1 << i) and before + chr(97 + i) + after in self.deleted:
+                    mask &= ~(1 << i)
+        if self.overlay is not None:
+            mask |= self.overlay.middle_hooks_of(before, after)
+        return mask
+
+    def walk(self, prefix: str, node: int = 0, reverse: bool = False) -> int:
+        """
+        Follows the letters of prefix down the trie from node, returning
+        the node reached or -1 if no word continues that way
+        """
+        first_edge = self.reverse_first_edge if reverse else self.first_edge
+        labels = self.reverse_labels if reverse else self.labels
+
+        for letter in prefix:
+            edge = labels.find(letter, first_edge[node], first_edge[node + 1])
+            if edge < 0:
+                return -1
+            node = edge + 1
+
+        return node
+
+    def is_word(self, word: str) -> bool:
+        """Returns True if the word exists in the lexicon, false otherwise"""
+        if self.base is not None:
+            return word not in self.deleted and (
+                self.base.is_word(word)
+                or (self.overlay is not None and self.overlay.is_word(word))
+            )
+        if not word.isascii():
+            return False
+
+        data = word.encode("ascii")
+        table = self.word_table
+        offsets = self.word_offsets
+        blob = self.word_blob
+        mask = len(table) - 1
+
+        slot = zlib.crc32(data) & mask
+        while table[slot]:
+            index = table[slot]
+            if blob[offsets[index - 1] : offsets[index] - 1] == data:
+                return True
+            slot = (slot + 1) & mask
+
+        return False
+
+    def valid_words(self, words) -> list[bool]:
+        """Returns whether each of the given words exists in the lexicon"""
+        return list(map(self.is_word, words))
+
+    def is_prefix(self, prefix: str) -> bool:
+        """
+        Returns True if some word in the lexicon starts with prefix, which for a
+        patched lexicon includes prefixes of deleted words until it is compiled again
+        """
+        if self.overlay is not None and self.overlay.is_prefix(prefix):
+            return True
+        return self.walk(prefix) > -1
+
+    def front_hooks_of(self, fragment: str) -> int:
+        """Returns a mask of the letters that form a word when placed before fragment"""
+        if self.base is not None:
+            return self.patch_hooks(self.base.front_hooks_of(fragment), "", fragment)
+        node = self.walk(fragment[::-1], reverse=True)
+        return self.front_hooks[node] if node > -1 else 0
+
+    def back_hooks_of(self, fragment: str) -> int:
+        """Returns a mask of the letters that form a word when placed after fragment"""
+        if self.base is not None:
+            return self.patch_hooks(self.base.back_hooks_of(fragment), fragment, "")
+        node = self.walk(fragment)
+        return self.back_hooks[node] if node > -1 else 0
+
+    def middle_hooks_of(self, before: str, after: str) -> int:
+        """
+        Returns a mask of the letters that form a word when placed
+        between the fragments before and after
+        """
+        if after == "":
+            return self.back_hooks_of(before)
+        if before == "":
+            return self.front_hooks_of(after)
+        if self.base is not None:
+            return self.patch_hooks(
+                self.base.middle_hooks_of(before, after), before, after
+            )
+
+        node = self.walk(before)
+        if node < 0:
+            return 0
+
+        mask = 0
+        first_edge = self.first_edge
+        labels = self.labels
+        terminal = self.terminal
+
+        # Only letters that continue before can be hooks, so try each of them
+        for edge in range(first_edge[node], first_edge[node + 1]):
+            end = self.walk(after, edge + 1)
+            if end > -1 and terminal[end]:
+                mask |= 1 << (ord(labels[edge]) - 97)
+
+        return mask
+
+    def anagrams(
+        self, letters: str, wildcards: int = 0, min_length: int = 2
+    ) -> list[str]:
+        """
+        Finds every word that can be spelled using some of the given letters
+
+        The trie is searched depth first while the unused letters are tracked as
+        counts, so only branches the letters can still spell are ever visited.
+        Each wildcard lets every branch be followed once, so the search grows with
+        the number of words found: a seven letter rack with two wildcards spells
+        over ten thousand words and takes around a hundred times longer than with none
+
+        Attributes:
+            letters (str): The letters available to spell words with
+            wildcards (int): The number of blanks that may stand for any letter
+            min_length (int): The shortest word to include
+        Returns:
+            list of every word that can be formed, in no particular order
+        """
+        if self.base is not None:
+            found = [
+                word
+                for word in self.base.anagrams(letters, wildcards, min_length)
+                if word not in self.deleted
+            ]
+            if self.overlay is not None:
+                found += self.overlay.anagrams(letters, wildcards, min_length)
+            return found
+
+        counts = [0] * 26
+        for letter in letters:
+            counts[ord(letter) - 97] += 1
+
+        first_edge = self.first_edge
+        labels = self.labels
+        terminal = self.terminal
+        found: list[str] = []
+
+        def search(node: int, prefix: str, wildcards: int):
+            if terminal[node] and len(prefix) >= min_length:
+                found.append(prefix)
+
+            for edge in range(first_edge[node], first_edge[node + 1]):
+                letter = labels[edge]
+                index = ord(letter) - 97
+
+                # Always spend a real letter before a wildcard
+                if counts[index]:
+                    counts[index] -= 1
+                    search(edge + 1, prefix + letter, wildcards)
+                    counts[index] += 1
+                elif wildcards:
+                    search(edge + 1, prefix + letter, wildcards - 1)
+
+        search(0, "", wildcards)
+        return found
+
+    def containing(self, letters: str) -> list[str]:
+        """Finds every word that uses at least the given letters, in sorted order"""
+        if self.base is not None:
+            found = [
+                word
+                for word in self.base.containing(letters)
+                if word not in self.deleted
+            ]
+            if self.overlay is not None:
+                found = sorted(found + self.overlay.containing(letters))
+            return found
+
+        required = letter_mask(letters)
+        repeated = {letter: letters.count(letter) for letter in set(letters)}
+        repeated = {letter: n for letter, n in repeated.items() if n > 1}
+
+        words = self.words
+        found: list[str] = []
+
+        for i, mask in enumerate(self.word_masks):
+            if mask & required == required:
+                word = words[i]
+                if all(word.count(letter) >= n for letter, n in repeated.items()):
+                    found.append(word)
+
+        return found
+
+    # suppress warning for too many arguments and locals
+    # pylint: disable=R0913,R0917,R0914
+    def match_line(
+        self,
+        line: str,
+        allowed: list[int] | None = None,
+        letters: str = "",
+        wildcards: int = 0,
+        anchors: list[bool] | None = None,
+        starts=None,
+        stats=None,
+    ):
+        """
+        Finds every word that can be placed along a line of squares
+
+        A word may start on any square, must fill every square it covers and may
+        not have an occupied square directly before or after it. The trie walk is
+        pruned by the fixed letters, the allowed letters and the remaining letters,
+        so no word is ever built just to be rejected afterwards
+
+        Attributes:
+            line (str): One character per square, a letter for an occupied square
+                and EMPTY_SQUARE for an empty one
+            allowed (list(int)): Mask of the letters allowed on each square
+            letters (str): The letters available to fill empty squares
+            wildcards (int): The number of blanks that may stand for any letter
+            anchors (list(bool)): Squares a word must cover at least one of, unless
+                it already runs through an occupied square
+            starts (iterable(int)): The squares words may start on, all by default
+            stats (SearchStats): Counts the trie nodes visited while profiling, if given
+        Yields:
+            (start, word, blanks) for every match, where start is the index of its
+            first square and blanks holds the indices filled by a wildcard
+        """
+        if self.base is not None:
+            starts = list(starts) if starts is not None else None
+            for match in self.base.match_line(
+                line, allowed, letters, wildcards, anchors, starts, stats
+            ):
+                if match[1] not in self.deleted:
+                    yield match
+            if self.overlay is not None:
+                yield from self.overlay.match_line(
+                    line, allowed, letters, wildcards, anchors, starts, stats
+                )
+            return
+
+        size = len(line)
+        if allowed is None:
+            allowed = [ALL_LETTERS] * size
+        if anchors is None:
+            anchors = [True] * size
+
+        counts = [0] * 26
+        for letter in letters:
+            counts[ord(letter) - 97] += 1
+
+        first_edge = self.first_edge
+        labels = self.labels
+        terminal = self.terminal
+        blanks: list[int] = []
+
+        def search(node, pos, start, prefix, used, touched, wildcards):
+            if stats is not None:
+                stats.nodes_visited += 1
+            # a word must use a letter, cover an anchor and end before an empty square
+            if terminal[node] and used and touched and pos - start > 1:
+                if pos == size or line[pos] == EMPTY_SQUARE:
+                    yield start, prefix, tuple(blanks)
+
+            if pos == size:
+                return
+
+            square = line[pos]
+            if square != EMPTY_SQUARE:
+                edge = labels.find(square, first_edge[node], first_edge[node + 1])
+                if edge > -1:
+                    yield from search(
+                        edge + 1, pos + 1, start, prefix + square, used, True, wildcards
+                    )
+                return
+
+            mask = allowed[pos]
+            touched = touched or anchors[pos]
+
+            for edge in range(first_edge[node], first_edge[node + 1]):
+                letter = labels[edge]
+                index = ord(letter) - 97
+                if not mask & (1 << index):
+                    continue
+
+                # Always spend a real letter before a wildcard
+                if counts[index]:
+                    counts[index] -= 1
+                    yield from search(
+                        edge + 1,
+                        pos + 1,
+                        start,
+                        prefix + letter,
+                        True,
+                        touched,
+                        wildcards,
+                    )
+                    counts[index] += 1
+                elif wildcards:
+                    blanks.append(pos)
+                    yield from search(
+                        edge + 1,
+                        pos + 1,
+                        start,
+                        prefix + letter,
+                        True,
+                        touched,
+                        wildcards - 1,
+                    )
+                    blanks.pop()
+
+        if starts is None:
+            starts = range(size - 1)
+
+        for start in starts:
+            if start == 0 or line[start - 1] == EMPTY_SQUARE:
+                yield from search(0, start, start, "", False, False, wildcards)
+
+    def match_pattern(
+        self,
+        pattern: str,
+        allowed: list[int] | None = None,
+        letters: str = "",
+        wildcards: int = 0,
+    ) -> list[tuple[str, tuple[int, ...]]]:
+        """
+        Finds every word that fills the whole pattern, such as "??a?e", using the
+        given letters for its empty squares, as (word, blank indices) pairs
+        """
+        return [
+            (word, blanks)
+            for _, word, blanks in self.match_line(
+                pattern, allowed, letters, wildcards, starts=(0,)
+            )
+            if len(word) == len(pattern)
+        ]
+
+
+# suppress warning for too many attributes
+# pylint: disable=R0902
+class LexiconRegistry:
+    """
+    Class which loads lexicons by identifier and shares them between games
+
+    Every word list is compiled once into a file in the cache directory named by
+    the hash of the list's contents, which later loads simply memory-map. Loaded
+    lexicons are kept in least recently used order, and the oldest are dropped
+    once they use more than max_bytes between them
+
+    Reloading a word list replaces the registry's lexicon with a new version, so
+    games holding the previous version keep using it until they fetch it again.
+    The new version is first the old one patched with the words inserted and
+    deleted, and then the word list compiled again in full
+
+    Attributes:
+        sources (dict(str, str)): The word list file for each lexicon identifier
+        cache_dir (str): The directory holding compiled lexicons
+        max_bytes (int): The memory the loaded lexicons may use before eviction
+        loaded (OrderedDict(str, Lexicon)): The loaded lexicons, oldest first
+        hashes (dict(str, str)): The hash of the word list each loaded lexicon
+            was compiled from
+        versions (dict(str, int)): The number of times each lexicon was reloaded
+    """
+
+    def __init__(self, sources: dict[str, str], cache_dir: str, max_bytes: int):
+        self.sources: dict[str, str] = sources
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = max_bytes
+        self.loaded: OrderedDict[str, Lexicon] = OrderedDict()
+        self.hashes: dict[str, str] = {}
+        self.versions: dict[str, int] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.loading_locks: dict[str, threading.Lock] = {}
+
+    def get(self, lexicon_id: str, progress=None) -> Lexicon:
+        """
+        Returns the lexicon with the given identifier, loading it if needed
+
+        Identifiers not listed in sources are treated as paths to a word list
+        """
+        with self.lock:
+            if lexicon_id in self.loaded:
+                self.loaded.move_to_end(lexicon_id)
+                return self.loaded[lexicon_id]
+            loading_lock = self.loading_locks.setdefault(lexicon_id, threading.Lock())
+
+        # Only one thread loads each lexicon, the others wait for it here
+        with loading_lock:
+            with self.lock:
+                if lexicon_id in self.loaded:
+                    self.loaded.move_to_end(lexicon_id)
+                    return self.loaded[lexicon_id]
+
+            path = self.sources.get(lexicon_id, lexicon_id)
+            digest = file_hash(path)
+            lexicon = self.load_cached(digest, progress)
+            if lexicon is None:
+                lexicon = Lexicon.from_file(path, progress)
+                self.save_cached(lexicon, digest)
+
+            lexicon.digest = digest
+            with self.lock:
+                self.loaded[lexicon_id] = lexicon
+                self.hashes[lexicon_id] = digest
+                self.evict()
+
+        return lexicon
+
+    def peek(self, lexicon_id: str) -> Lexicon:
+        """Returns the current version of a lexicon if it is loaded, otherwise None"""
+        with self.lock:
+            return self.loaded.get(lexicon_id)
+
+    def get_version(self, lexicon_id: str) -> int:
+        """Getter function for the number of times a lexicon was reloaded"""
+        return self.versions.get(lexicon_id, 0)
+
+    def reload(self, lexicon_id: str) -> threading.Thread:
+        """
+        Starts reloading a lexicon's word list on a background thread,
+        returning the thread so callers can wait for it if they need to
+        """
+        thread = threading.Thread(target=self.apply_reload, args=(lexicon_id,))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def apply_reload(self, lexicon_id: str) -> bool:
+        """
+        Brings a lexicon up to date with its word list, returning whether it changed
+
+        The words inserted and deleted since it was loaded are applied as a patch
+        straight away, and the word list is then compiled again in full on the same
+        thread to replace the patch. The old lexicon is left unchanged for anything
+        still reading it
+        """
+        path = self.sources.get(lexicon_id, lexicon_id)
+        current = self.get(lexicon_id)
+        with self.lock:
+            loading_lock = self.loading_locks.setdefault(lexicon_id, threading.Lock())
+
+        with loading_lock:
+            digest = file_hash(path)
+            if digest == self.hashes.get(lexicon_id):
+                return False
+
+            lexicon = self.load_cached(digest)
+            compiled = lexicon is not None
+            if not compiled:
+                inserted, deleted = current.diff(read_words(path))
+                lexicon = current.patched(inserted, deleted)
+
+            lexicon.digest = digest
+            with self.lock:
+                self.loaded[lexicon_id] = lexicon
+                self.loaded.move_to_end(lexicon_id)
+                self.hashes[lexicon_id] = digest
+                self.versions[lexicon_id] = self.get_version(lexicon_id) + 1
+                self.evict()
+
+            if not compiled:
+                self.compact(lexicon_id, lexicon)
+
+        return True
+
+    def compact(self, lexicon_id: str, patched: Lexicon):
+        """
+        Compiles the words of a patched lexicon in full and caches the result,
+        replacing the patched lexicon if it is still the latest version
+        """
+        lexicon = Lexicon(patched.words)
+        lexicon.digest = patched.digest
+        self.save_cached(lexicon, lexicon.digest)
+
+        with self.lock:
+            if self.loaded.get(lexicon_id) is patched:
+                self.loaded[lexicon_id] = lexicon
+                self.evict()
+
+    def load_cached(self, digest: str, progress=None) -> Lexicon:
+        """
+        Loads the compiled lexicon with the given hash, or None if it is not cached
+        or the cache cannot be read, so the word list is compiled instead
+        """
+        cache_path = os.path.join(self.cache_dir, f"{digest}.lex")
+
+        if os.path.exists(cache_path):
+            try:
+                lexicon = Lexicon.load(cache_path)
+                if progress:
+                    progress(1.0)
+                return lexicon
+            except (OSError, ValueError):
+                pass
+
+        return None
+
+    def save_cached(self, lexicon: Lexicon, digest: str):
+        """
+        Saves a compiled lexicon to the cache under the hash of its word list,
+        doing nothing if the cache cannot be written, since it only saves compiling
+        the word list again next time
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            lexicon.save(os.path.join(self.cache_dir, f"{digest}.lex"))
+        except OSError:
+            pass
+
+    def memory_usage(self) -> int:
+        """Returns the approximate memory used by all loaded lexicons"""
+        return sum(lexicon.nbytes() for lexicon in self.loaded.values())
+
+    def evict(self):
+        """Drops the least recently used lexicons until the memory limit is met"""
+        while len(self.loaded) > 1 and self.memory_usage() > self.max_bytes:
+            self.loaded.popitem(last=False)
+
+
+def read_words(path: str, progress=None) -> list[str]:
+    """
+    Reads a file containing one word per line, calling progress with the
+    fraction of the file read scaled to the first fifth of compiling
+    """
+    size = max(os.path.getsize(path), 1)
+    words: list[str] = []
+    read = 0
+
+    with open(path, "r", encoding="utf-8") as file:
+        for i, line in enumerate(file):
+            read += len(line)
+            word = line.strip()
+            if word:
+                words.append(word)
+            if progress and i % 10000 == 0:
+                progress(0.2 * read / size)
+
+    return words
+
+
+def file_hash(path: str) -> str:
+    """Returns the SHA-256 hash of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LexiconLoader:
+    """
+    Class which loads a lexicon from a registry on a background thread
+    the first time it is needed
+
+    Attributes:
+        registry (LexiconRegistry): The registry to load the lexicon from
+        lexicon_id (str): The identifier of the lexicon to load
+        lexicon (Lexicon): The loaded lexicon, None until loading finishes
+        progress (float): The fraction of the loading done so far
+        error (Exception): The error raised while loading, if any
+        thread (threading.Thread): The thread doing the loading, None until started
+    """
+
+    def __init__(self, registry: LexiconRegistry, lexicon_id: str):
+        self.registry: LexiconRegistry = registry
+        self.lexicon_id: str = lexicon_id
+        self.lexicon: Lexicon = None
+        self.progress: float = 0.0
+        self.error: Exception = None
+        self.thread: threading.Thread = None
+        self.lock: threading.Lock = threading.Lock()
+
+    def start(self):
+        """Starts loading the lexicon in the background if it has not been started"""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.load, daemon=True)
+                self.thread.start()
+
+    def load(self):
+        """Loads the lexicon, storing any error for the thread calling get"""
+        # suppress warning for catching a broad exception, get re-raises it
+        # pylint: disable=W0718
+        try:
+            self.lexicon = self.registry.get(self.lexicon_id, self.set_progress)
+        except Exception as error:
+            self.error = error
+
+    def set_progress(self, progress: float):
+        """Setter function for progress"""
+        self.progress = progress
+
+    def is_ready(self) -> bool:
+        """Returns whether the lexicon has finished loading"""
+        return self.lexicon is not None
+
+    def attach(self, name: str):
+        """
+        Uses a lexicon shared by another process through Lexicon.share
+        instead of compiling the word list again
+        """
+        with self.lock:
+            self.lexicon = Lexicon.attach(name)
+            self.progress = 1.0
+
+    def get(self) -> Lexicon:
+        """
+        Returns the latest version of the lexicon, waiting for it to load
+        if it is not ready yet
+        """
+        if self.lexicon is None:
+            self.start()
+            self.thread.join()
+
+            if self.error is not None:
+                raise self.error
+
+        latest = self.registry.peek(self.lexicon_id)
+        if latest is not None:
+            self.lexicon = latest
+
+        return self.lexicon
@@ -0,0 +1,109 @@
+"""Module containing the definition for a MovePreview object"""
+
+from .board import Board, Span, ACROSS
+from .events import TILE_PLACED, TILE_REMOVED, BOARD_SET
+from .utils import valid_words
+
+
+class MovePreview:
+    """
+    Class which previews the move being placed on a board as it is placed, the same
+    way Board.play_turn would judge it, with whether it is legal, the words it forms
+    with their scores and whether it is a bingo
+
+    The preview is only worked out when it is asked for after the board changed, and
+    then only the words covering a square changed since the last preview are spelled,
+    looked up and scored again, every other word of the last preview being reused
+
+    Attributes:
+        board (Board): The board whose current turn tiles are previewed
+        words (dict(Span, tuple(str, int, bool))): The word covered by each span of the
+            last preview, with its score and whether it is in the lexicon
+        changed_squares (set(tuple(int, int))): The squares changed since the last preview
+        preview (tuple(bool, dict(str, int), bool)): The last preview, or None if the
+            board has changed since it was worked out
+    """
+
+    def __init__(self, board: Board):
+        self.board: Board = board
+        self.words: dict[Span, tuple[str, int, bool]] = {}
+        self.changed_squares: set[tuple[int, int]] = set()
+        self.preview: tuple[bool, dict[str, int], bool] = None
+
+        board.subscribe(TILE_PLACED, self.mark_changed)
+        board.subscribe(TILE_REMOVED, self.mark_changed)
+        board.subscribe(BOARD_SET, lambda _: self.clear())
+
+    def mark_changed(self, row: int, col: int):
+        """Marks a square as changed, so the words covering it are worked out again"""
+        # with no words to reuse, such as while the AI tests moves, nothing is recorded
+        if self.words:
+            self.changed_squares.add((row, col))
+        self.preview = None
+
+    def clear(self):
+        """Forgets every word of the last preview, called whenever a turn ends"""
+        self.words.clear()
+        self.changed_squares.clear()
+        self.preview = None
+
+    def get_preview(self) -> tuple[bool, dict[str, int], bool]:
+        """
+        Returns whether the tiles placed this turn make a legal turn, every word
+        they form with its score, even when the turn is not legal, and whether
+        the turn is a bingo
+        """
+        if self.preview is None:
+            self.preview = self.evaluate()
+        return self.preview
+
+    def get_invalid_words(self) -> list[str]:
+        """Returns the words of the last preview which are not in the lexicon"""
+        self.get_preview()
+        return [word for word, _, valid in self.words.values() if not valid]
+
+    def evaluate(self) -> tuple[bool, dict[str, int], bool]:
+        """Works out the preview, reusing the words of the last one no changed square covers"""
+        board = self.board
+        placed = {tile.coords for tile in board.get_current_turn_tiles()}
+        spans = board.find_words()
+
+        words: dict[Span, tuple[str, int, bool]] = {}
+        changed: list[Span] = []
+        for span in spans:
+            cached = self.words.get(span)
+            if cached is None or self.covers_changed_square(span):
+                changed.append(span)
+            words[span] = cached
+
+        if changed:
+            spelled = [board.span_to_str(span) for span in changed]
+            for span, word, valid in zip(
+                changed, spelled, valid_words(spelled, board.get_lexicon())
+            ):
+                words[span] = (word, board.score_word(span, placed), valid)
+
+        # the words stay in the order play_turn finds them, so the scores match
+        self.words = words
+        self.changed_squares.clear()
+
+        legal_turn = (
+            len(self.words) > 0
+            and all(valid for _, _, valid in self.words.values())
+            and board.forms_connected_line()
+        )
+        words_dict = {word: score for word, score, _ in self.words.values()}
+
+        return legal_turn, words_dict, len(placed) >= 7
+
+    def covers_changed_square(self, span: Span) -> bool:
+        """Returns whether a span covers any square changed since the last preview"""
+        (start_row, start_col), (end_row, end_col), direction = span
+
+        for row, col in self.changed_squares:
+            if direction == ACROSS:
+                if row == start_row and start_col <= col <= end_col:
+                    return True
+            elif col == start_col and start_row <= row <= end_row:
+                return True
+        return False
@@ -0,0 +1,243 @@
+"""Module containing the definition for an OpeningBook object"""
+
+import mmap
+import os
+import struct
+import weakref
+from bisect import bisect_left
+
+from .config import LEXICON_CACHE_DIR
+from .lexicon import Lexicon
+from .tile import SLOT_KEYS
+
+# A first move as (first column, word, bitmask of the word's letters played as blanks)
+BookMove = tuple[int, str, int]
+
+# Bumped whenever move generation or scoring changes, so a book of moves chosen
+# by an older AI is discarded instead of replayed
+BOOK_VERSION = 2
+BOOK_HEADER = struct.Struct("<4sI")
+BOOK_MAGIC = b"OPN" + bytes([BOOK_VERSION])
+
+# The number of racks added in memory before the book is written to its file
+BOOK_SAVE_INTERVAL = 16
+BOOK_MOVE = struct.Struct("<BBH")
+KEY_SIZE = len(SLOT_KEYS)
+NO_MOVE = 255
+
+
+class OpeningBook:
+    """
+    Class which remembers the first moves chosen for each rack
+
+    On an empty board the best move only depends on the tiles in the rack, and
+    every square of the center row mirrors the center column, so the chosen
+    moves are stored once per rack as across moves on the center row
+
+    The book file holds a header, the sorted rack keys, the offset of each
+    rack's entry and then the entries, and is memory-mapped so a lookup is a
+    binary search that only reads the pages it touches. Racks added since the
+    file was written are kept in memory until the book is saved, which happens
+    every BOOK_SAVE_INTERVAL racks and when a game ends
+
+    Attributes:
+        path (str): The file the book is stored in, None for a book kept in memory
+        mapping (mmap): The memory-mapped book file, None if there is no file
+        size (int): The number of racks in the book file
+        added (dict(bytes, list(BookMove))): Racks added since the file was written
+    """
+
+    def __init__(self, path: str = None):
+        self.path: str = path
+        self.mapping: mmap.mmap = None
+        self.size: int = 0
+        self.added: dict[bytes, list[BookMove]] = {}
+
+        if path is not None and os.path.exists(path):
+            self.open()
+
+    def open(self):
+        """Memory-maps the book file, ignoring it if it is not a valid book"""
+        try:
+            with open(self.path, "rb") as file:
+                if os.fstat(file.fileno()).st_size < BOOK_HEADER.size:
+                    return
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return
+
+        magic, size = BOOK_HEADER.unpack_from(mapping)
+        if magic != BOOK_MAGIC:
+            mapping.close()
+            return
+
+        self.mapping = mapping
+        self.size = size
+
+    def close(self):
+        """Unmaps the book file"""
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+            self.size = 0
+
+    def __len__(self) -> int:
+        return self.size + len(self.added)
+
+    def get(self, key: bytes) -> list[BookMove] | None:
+        """
+        Returns the moves chosen for a rack, one for each AI personality and None
+        where no move was found, or None if the rack is not in the book
+        """
+        if key in self.added:
+            return self.added[key]
+
+        index = bisect_left(FileKeys(self), key)
+        if index < self.size and self.key_at(index) == key:
+            return self.entry_at(index)
+
+        return None
+
+    def add(self, key: bytes, moves: list[BookMove | None]):
+        """Adds the moves chosen for a rack to the book, saving every few racks"""
+        self.added[key] = moves
+        if len(self.added) >= BOOK_SAVE_INTERVAL:
+            self.save()
+
+    def key_at(self, index: int) -> bytes:
+        """Returns the key of the rack at an index of the book file"""
+        start = BOOK_HEADER.size + index * KEY_SIZE
+        return self.mapping[start : start + KEY_SIZE]
+
+    def offset_at(self, index: int) -> int:
+        """Returns where the entry of the rack at an index starts in the book file"""
+        offsets_start = BOOK_HEADER.size + self.size * KEY_SIZE
+        return struct.unpack_from("<I", self.mapping, offsets_start + 4 * index)[0]
+
+    def raw_entry_at(self, index: int) -> bytes:
+        """Returns the encoded moves of the rack at an index of the book file"""
+        end = self.offset_at(index + 1) if index + 1 < self.size else len(self.mapping)
+        return self.mapping[self.offset_at(index) : end]
+
+    def entry_at(self, index: int) -> list[BookMove | None]:
+        """Decodes the moves of the rack at an index of the book file"""
+        offset = self.offset_at(index)
+
+        moves: list[BookMove | None] = []
+        count = self.mapping[offset]
+        offset += 1
+
+        for _ in range(count):
+            start, length, blanks = BOOK_MOVE.unpack_from(self.mapping, offset)
+            offset += BOOK_MOVE.size
+            if start == NO_MOVE:
+                moves.append(None)
+                continue
+
+            word = str(self.mapping[offset : offset + length], "ascii")
+            offset += length
+            moves.append((start, word, blanks))
+
+        return moves
+
+    def save(self) -> bool:
+        """
+        Writes every rack in the book to its file, replacing the file atomically,
+        and returns whether it was written
+
+        Racks already in the file are copied without being decoded. The book is only
+        a cache, so if the file cannot be written the added racks stay in memory
+        """
+        if self.path is None or not self.added:
+            return False
+
+        entries = {self.key_at(i): self.raw_entry_at(i) for i in range(self.size)}
+        entries.update((key, encode_entry(moves)) for key, moves in self.added.items())
+        keys = sorted(entries)
+
+        offsets: list[int] = []
+        offset = BOOK_HEADER.size + len(keys) * (KEY_SIZE + 4)
+        for key in keys:
+            offsets.append(offset)
+            offset += len(entries[key])
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(BOOK_HEADER.pack(BOOK_MAGIC, len(keys)))
+                file.write(b"".join(keys))
+                file.write(struct.pack(f"<{len(keys)}I", *offsets))
+                file.write(b"".join(entries[key] for key in keys))
+
+            self.close()
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if self.mapping is None:
+                self.open()
+            return False
+
+        self.added.clear()
+        self.open()
+        return True
+
+
+def encode_entry(moves: list[BookMove | None]) -> bytes:
+    """Encodes the moves chosen for a rack as they are stored in the book file"""
+    data = bytearray([len(moves)])
+    for move in moves:
+        if move is None:
+            data += BOOK_MOVE.pack(NO_MOVE, 0, 0)
+        else:
+            start, word, blanks = move
+            data += BOOK_MOVE.pack(start, len(word), blanks)
+            data += word.encode("ascii")
+    return bytes(data)
+
+
+class FileKeys:
+    """
+    Class which presents the rack keys of a book file as a sequence,
+    so they can be binary searched without being read into a list
+
+    Attributes:
+        book (OpeningBook): The book whose file keys are presented
+    """
+
+    def __init__(self, book: OpeningBook):
+        self.book: OpeningBook = book
+
+    def __len__(self) -> int:
+        return self.book.size
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.book.key_at(index)
+
+
+# Opening books by the hash of the word list they were built with
+OPENING_BOOKS: dict[str, OpeningBook] = {}
+
+# Opening books of lexicons not loaded through a registry, kept while the lexicon is
+MEMORY_BOOKS: weakref.WeakKeyDictionary[Lexicon, OpeningBook] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_opening_book(lexicon: Lexicon) -> OpeningBook:
+    """
+    Returns the opening book for a lexicon, kept in the lexicon cache directory
+    when the lexicon was loaded through a registry and only in memory otherwise
+    """
+    if lexicon.digest is None:
+        if lexicon not in MEMORY_BOOKS:
+            MEMORY_BOOKS[lexicon] = OpeningBook()
+        return MEMORY_BOOKS[lexicon]
+
+    if lexicon.digest not in OPENING_BOOKS:
+        OPENING_BOOKS[lexicon.digest] = OpeningBook(
+            os.path.join(LEXICON_CACHE_DIR, f"{lexicon.digest}.book")
+        )
+
+    return OPENING_BOOKS[lexicon.digest]
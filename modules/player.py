@@ -1,24 +1,33 @@
 """Module containing the definition for a Player object"""
 
 from .drawbag import Drawbag
+from .events import EventEmitter, SCORE_CHANGED
 from .rack import Rack
 from .tile import Tile
+from .unseen import UnseenTiles
 
 
-class Player:
+class Player(EventEmitter):
     """
-    Class representing a player
+    Class representing a player, which publishes an event whenever their score changes
 
     Attributes:
         name (str): The player's name
         rack (Rack): The player's rack of tiles
         score (int): The player's current score
+        unseen (UnseenTiles): The tiles the player has not seen yet
+        last_play (list(int)): The count slots of the tiles the player placed
+            on their last turn
     """
 
     def __init__(self, name: str, drawbag: Drawbag):
+        super().__init__()
         self.name: str = name
-        self.rack: Rack = Rack(drawbag)
+        self.unseen: UnseenTiles = UnseenTiles(drawbag.derive_rng())
+        self.rack: Rack = Rack()
         self.score: int = 0
+        self.last_play: list[int] = []
+        self.refill_rack(drawbag)
 
     def get_name(self) -> str:
         """Getter function for the player's name"""
@@ -38,7 +47,19 @@ class Player:
 
     def refill_rack(self, drawbag: Drawbag):
         """Function to refill the player's rack when a turn is played"""
-        self.rack.fill_rack(drawbag)
+        self.unseen.see_slots(self.rack.fill_rack(drawbag))
+
+    def get_unseen(self) -> UnseenTiles:
+        """Getter function for the tiles the player has not seen"""
+        return self.unseen
+
+    def get_last_play(self) -> list[int]:
+        """Getter function for the count slots the player placed last turn"""
+        return self.last_play
+
+    def set_last_play(self, last_play: list[int]):
+        """Setter function for last_play"""
+        self.last_play = last_play
 
     def get_score(self) -> int:
         """Getter function for the player's current sore"""
@@ -47,6 +68,7 @@ class Player:
     def add_score(self, score: int):
         """Function to increment the player's score"""
         self.score += score
+        self.emit(SCORE_CHANGED, self)
 
     def add_tiles(self, tiles: list[Tile]):
         """Adds tiles to the rack from a passed list of tiles"""
@@ -0,0 +1,131 @@
+"""Module containing the definition for a ProfileOverlay object"""
+
+import os
+import time
+from .config import arcade, WINDOW_HEIGHT, PROFILE_EXPORT_DIR
+from .profiler import Profiler
+from .text_layer import TextLayer
+
+# Seconds between updates of the overlay's text, so showing it costs little
+OVERLAY_INTERVAL = 0.25
+
+# Position and size of the overlay's lines, from the top left of the window
+OVERLAY_LEFT = 10
+OVERLAY_TOP = WINDOW_HEIGHT - 10
+OVERLAY_WIDTH = 640
+OVERLAY_LINE_HEIGHT = 18
+
+# Sections shown on their own lines rather than as timed code
+OVERLAY_SKIPPED = ("frame", "ai_turn")
+
+
+class ProfileOverlay:
+    """
+    Class which shows what the profiler has recorded over the top left of the window,
+    profiling only while it is shown
+
+    Attributes:
+        profiler (Profiler): The profiler whose samples are shown
+        visible (bool): Whether the overlay is shown
+        text_layer (TextLayer): The lines of the overlay
+        line_count (int): The number of lines currently shown
+        last_update (float): The time the lines were last updated
+        message (str): A line shown at the bottom of the overlay, such as
+            where the samples were last exported to
+    """
+
+    def __init__(self, profiler: Profiler):
+        self.profiler: Profiler = profiler
+        self.visible: bool = False
+        self.text_layer: TextLayer = TextLayer(
+            font_size=12,
+            font_name=("Courier New", "Courier", "monospace"),
+            anchor_y="top",
+        )
+        self.line_count: int = 0
+        self.last_update: float = 0.0
+        self.message: str = "F3 hide   F4 export"
+
+    def toggle(self):
+        """Shows or hides the overlay, profiling only while it is shown"""
+        self.visible = not self.visible
+        self.profiler.set_enabled(self.visible)
+        self.last_update = 0.0
+
+    def export(self, directory: str = PROFILE_EXPORT_DIR) -> str:
+        """
+        Exports the profiler's samples as JSONL to a new file in a directory,
+        returning the file's path
+        """
+        path = os.path.join(
+            directory, time.strftime("profile_%Y%m%d_%H%M%S.jsonl", time.localtime())
+        )
+        count = self.profiler.export(path)
+        self.message = f"Exported {count} samples to {path}"
+        self.last_update = 0.0
+        return path
+
+    def get_lines(self, counts: dict[str, int]) -> list[str]:
+        """Returns the lines of the overlay, given the number of each object drawn"""
+        profiler = self.profiler
+        lines = [
+            f"FPS {profiler.get_fps():5.1f}   frame "
+            + format_percentiles(profiler.get_percentiles("frame"))
+        ]
+
+        for section in profiler.get_sections():
+            if section not in OVERLAY_SKIPPED:
+                lines.append(
+                    f"{section:<26}"
+                    + format_percentiles(profiler.get_percentiles(section))
+                )
+
+        lines.append("   ".join(f"{name} {count}" for name, count in counts.items()))
+
+        ai_turn = profiler.latest.get("ai_turn")
+        if ai_turn is not None:
+            lines.append(
+                f"AI {ai_turn['player']}: generation {ai_turn['generation_ms']:.1f} ms, "
+                f"validation {ai_turn['validation_ms']:.1f} ms, "
+                f"scoring {ai_turn['scoring_ms']:.1f} ms"
+            )
+            lines.append(
+                f"    {ai_turn['moves_tested']} moves tested, "
+                f"{ai_turn['nodes_visited']} nodes visited"
+            )
+
+        lines.append(self.message)
+        return lines
+
+    def update(self, counts: dict[str, int]):
+        """Sets the lines of the overlay, hiding any left over from a longer update"""
+        lines = self.get_lines(counts)
+        for i, line in enumerate(lines):
+            self.text_layer.set_text(
+                i, line, OVERLAY_LEFT, OVERLAY_TOP - OVERLAY_LINE_HEIGHT * i
+            )
+        for i in range(len(lines), self.line_count):
+            self.text_layer.hide(i)
+
+        self.line_count = len(lines)
+        self.last_update = time.perf_counter()
+
+    def draw(self, counts: dict[str, int]):
+        """Draws the overlay over a dark backdrop, updating its lines every interval"""
+        if time.perf_counter() - self.last_update >= OVERLAY_INTERVAL:
+            self.update(counts)
+
+        arcade.draw_lrbt_rectangle_filled(
+            OVERLAY_LEFT - 5,
+            OVERLAY_LEFT + OVERLAY_WIDTH,
+            OVERLAY_TOP - OVERLAY_LINE_HEIGHT * self.line_count - 5,
+            OVERLAY_TOP + 5,
+            (0, 0, 0, 190),
+        )
+        self.text_layer.draw()
+
+
+def format_percentiles(percentiles: list[float]) -> str:
+    """Formats the 50th, 95th and 99th percentiles of a section in milliseconds"""
+    p50, p95, p99 = percentiles
+    return f"p50 {p50:7.2f}  p95 {p95:7.2f}  p99 {p99:7.2f} ms"
@@ -0,0 +1,153 @@
+"""Module containing the definition for a Profiler object"""
+
+import os
+import json
+import time
+import functools
+from collections import deque
+
+# The number of recent durations kept for the percentiles of each section
+PROFILE_SAMPLES = 300
+
+# The number of recent samples of every section kept for exporting
+PROFILE_RECORDS = 20000
+
+
+class Profiler:
+    """
+    Class which times the hot paths of the game while it is enabled,
+    keeping the most recent durations of each section for percentiles
+    and every recent sample in order for exporting as JSONL
+
+    Attributes:
+        enabled (bool): Whether sections are timed, so the profiler costs
+            a single check while it is not
+        samples (dict(str, deque(float))): The most recent durations of each section,
+            in milliseconds
+        records (deque(dict)): The most recent samples of every section in the
+            order they were taken, with any extra fields they were recorded with
+        latest (dict(str, dict)): The last sample of each section
+        start (float): The time the profiler was created, which samples are timed from
+        last_frame (float): The time the last frame started, or None if no frame
+            has started since the profiler was enabled
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.samples: dict[str, deque[float]] = {}
+        self.records: deque[dict] = deque(maxlen=PROFILE_RECORDS)
+        self.latest: dict[str, dict] = {}
+        self.start: float = time.perf_counter()
+        self.last_frame: float = None
+
+    def set_enabled(self, enabled: bool):
+        """Setter function for whether sections are timed"""
+        self.enabled = enabled
+        self.last_frame = None
+
+    def record(self, section: str, duration: float, **fields):
+        """Records a sample of a section lasting duration milliseconds"""
+        if section not in self.samples:
+            self.samples[section] = deque(maxlen=PROFILE_SAMPLES)
+        self.samples[section].append(duration)
+
+        record = {
+            "section": section,
+            "time": round(time.perf_counter() - self.start, 6),
+            "ms": round(duration, 4),
+        }
+        record.update(fields)
+        self.records.append(record)
+        self.latest[section] = record
+
+    def frame(self):
+        """Records the time since the last frame started, called as each frame starts"""
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.record("frame", (now - self.last_frame) * 1000)
+        self.last_frame = now
+
+    def get_fps(self) -> float:
+        """Returns the frames per second over the recent frames, or 0 if there are none"""
+        frames = self.samples.get("frame")
+        if not frames:
+            return 0.0
+        return 1000 * len(frames) / sum(frames)
+
+    def get_percentiles(
+        self, section: str, percents: tuple[int, ...] = (50, 95, 99)
+    ) -> list[float]:
+        """Returns the given percentiles of the recent durations of a section, in milliseconds"""
+        durations = sorted(self.samples.get(section, ()))
+        if not durations:
+            return [0.0 for _ in percents]
+
+        return [
+            durations[min(len(durations) - 1, len(durations) * percent // 100)]
+            for percent in percents
+        ]
+
+    def get_sections(self) -> list[str]:
+        """Returns the name of every section with a recorded sample"""
+        return list(self.samples)
+
+    def export(self, path: str) -> int:
+        """
+        Writes every recent sample to a file as one JSON object per line,
+        creating its directory if needed, and returns the number written
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        records = list(self.records)
+        with open(path, "w", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record) + "\n")
+
+        return len(records)
+
+
+PROFILER = Profiler()
+
+
+# suppress warning for too few public methods
+# pylint: disable=R0903
+class SearchStats:
+    """
+    Class which counts the work of one AI's move search while profiling,
+    passed down to the board and lexicon only while the profiler is enabled
+
+    Attributes:
+        moves_tested (int): The number of moves tested
+        nodes_visited (int): The number of trie nodes visited generating moves
+        validation_time (float): Seconds spent placing and validating moves
+        scoring_time (float): Seconds spent scoring valid moves
+    """
+
+    def __init__(self):
+        self.moves_tested: int = 0
+        self.nodes_visited: int = 0
+        self.validation_time: float = 0.0
+        self.scoring_time: float = 0.0
+
+
+def profiled(function):
+    """Decorator which records each call of a function under its name while profiling"""
+    section = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not PROFILER.enabled:
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            PROFILER.record(section, (time.perf_counter() - start) * 1000)
+
+    return wrapper
@@ -1,69 +1,162 @@
 """Module containing the definition for a Rack object"""
 
+import random
 from .drawbag import Drawbag
-from .tile import Tile
+from .events import EventEmitter, RACK_CHANGED, RACK_REORDERED
+from .tile import (
+    Tile,
+    SLOT_KEYS,
+    SLOT_VALUES,
+    BLANK_SLOT,
+    letter_slot,
+    tile_slot,
+    slot_tile,
+)
 
 RACK_SIZE = 7
 
 
-class Rack:
+class Rack(EventEmitter):
     """
     Class representing the rack of a player
 
+    The rack counts its tiles by letter and only creates Tile objects
+    the first time they are needed for display, and publishes an event
+    whenever its tiles or their order change
+
     Attributes:
-        rack (List(Tile)): A list containing the tiles a player currenlty has
+        counts (list(int)): The number of tiles of each letter in the rack,
+            indexed by count slot with blanks in the last slot
+        order (list(int)): The count slot of each tile, in display order
+        tiles (List(Tile)): The tiles a player currently has in display order,
+            None until they are first needed
     """
 
-    def __init__(self, drawbag: Drawbag):
+    def __init__(self, drawbag: Drawbag = None):
         """Initializes a rack object for the start of the game"""
-        self.rack: list[Tile] = []
-        self.fill_rack(drawbag)
+        super().__init__()
+        self.counts: list[int] = [0] * len(SLOT_KEYS)
+        self.order: list[int] = []
+        self.tiles: list[Tile] = None
+
+        if drawbag is not None:
+            self.fill_rack(drawbag)
 
     def add_tile(self, tile: Tile):
         """Fucntion to add a tile to the current rack"""
-        self.rack.append(tile)
+        self.insert_tile(tile, len(self.order))
 
     def insert_tile(self, tile: Tile, index: int):
         """Function to insert a tile into a specific position"""
-        self.rack.insert(index, tile)
+        slot = tile_slot(tile)
+        self.counts[slot] += 1
+        self.order.insert(index, slot)
+
+        if self.tiles is not None:
+            self.tiles.insert(index, tile)
+        self.emit(RACK_CHANGED, self)
+
+    def add_slot(self, slot: int):
+        """Adds a tile to the end of the rack by count slot"""
+        self.counts[slot] += 1
+        self.order.append(slot)
+
+        if self.tiles is not None:
+            self.tiles.append(slot_tile(slot))
+        self.emit(RACK_CHANGED, self)
 
     def get_rack(self) -> list[Tile]:
         """Getter function for the rack list"""
-        return self.rack
+        if self.tiles is None:
+            self.tiles = [slot_tile(slot) for slot in self.order]
+        return self.tiles
 
     def set_rack(self, new_rack: list[Tile]):
         """Setter function for the rack"""
-        self.rack = new_rack
+        self.counts = [0] * len(SLOT_KEYS)
+        self.order = []
+        self.tiles = []
+
+        for tile in new_rack:
+            self.add_tile(tile)
 
     def remove_tile(self, tile: Tile):
         """Removes a specified tile from the rack"""
-        self.rack.remove(tile)
-
-    def fill_rack(self, drawbag: Drawbag):
-        """Fills all empty spaces in the rack"""
-        while len(self.rack) < RACK_SIZE and not drawbag.is_empty():
-            self.rack.append(drawbag.draw_tile())
+        if self.tiles is not None:
+            self.remove_index(self.tiles.index(tile))
+        else:
+            self.remove_index(self.order.index(tile_slot(tile)))
+
+    def remove_index(self, index: int):
+        """Removes the tile at a position in the rack"""
+        slot = self.order.pop(index)
+        self.counts[slot] -= 1
+
+        if self.tiles is not None:
+            self.tiles.pop(index)
+        self.emit(RACK_CHANGED, self)
+
+    def fill_rack(self, drawbag: Drawbag) -> list[int]:
+        """Fills all empty spaces in the rack, returning the count slots drawn"""
+        drawn: list[int] = []
+        while len(self.order) < RACK_SIZE and not drawbag.is_empty():
+            drawn.append(drawbag.draw_slot())
+            self.add_slot(drawn[-1])
+        return drawn
 
     def len_rack(self):
         """Function to get the amount of tiles in the current rack"""
-        return len(self.rack)
+        return len(self.order)
 
     def get_rack_letters(self):
         """Returns a list of letters in the rack"""
-        letters: list[str] = []
+        return ["" if slot == BLANK_SLOT else SLOT_KEYS[slot] for slot in self.order]
 
-        for tile in self.rack:
-            letters.append(tile.letter)
+    def get_counts(self) -> list[int]:
+        """Getter function for the number of tiles in each count slot"""
+        return self.counts
 
-        return letters
+    def has_letter(self, letter: str) -> bool:
+        """Returns whether the rack holds a tile of a letter, the empty letter being a blank"""
+        return self.counts[letter_slot(letter)] > 0
 
     def remove_letter(self, letter: str):
         """Removes a tile from the rack by letter"""
-        for tile in self.rack:
-            if tile.letter == letter:
-                self.remove_tile(tile)
-                break
+        slot = letter_slot(letter)
+        if self.counts[slot] > 0:
+            self.remove_index(self.order.index(slot))
+
+    def swap(self, first: int, second: int):
+        """Swaps the positions of two tiles in the rack"""
+        order = self.order
+        order[first], order[second] = order[second], order[first]
+
+        if self.tiles is not None:
+            tiles = self.tiles
+            tiles[first], tiles[second] = tiles[second], tiles[first]
+        self.emit(RACK_REORDERED, self)
+
+    def shuffle(self, rng: random.Random = None):
+        """Shuffles the display order of the tiles in the rack"""
+        rng = rng or random
+        for i in range(len(self.order) - 1, 0, -1):
+            self.swap(i, rng.randint(0, i))
+
+    def get_value(self) -> int:
+        """Returns the total score value of the tiles in the rack"""
+        return sum(count * value for count, value in zip(self.counts, SLOT_VALUES))
+
+    def copy(self):
+        """Returns an independent rack holding the same tiles, without creating any Tile"""
+        rack = Rack()
+        rack.counts = self.counts[:]
+        rack.order = self.order[:]
+        return rack
+
+    def key(self) -> bytes:
+        """Returns the tiles in the rack as bytes, for use as a cache key"""
+        return bytes(self.counts)
 
     def is_empty(self) -> bool:
         """Returns whether the rack is empty"""
-        return len(self.rack) == 0
+        return len(self.order) == 0
@@ -1,6 +1,9 @@
 """Module containing the definition for a ScrabbleUI object"""
 
-import random
+# suppress warning for too many lines
+# pylint: disable=C0302
+
+from typing import Callable
 from .config import (
     arcade,
     SIZE,
@@ -12,19 +15,42 @@ from .config import (
     BOARD_CENTER_X,
     BOARD_CENTER_Y,
     BACKGROUND_COORDS,
-    LETTER_DIST,
     BACKGROUNDS,
 )
 from .tile import Tile
+from .textures import TEXTURES, get_texture
+from .hover import HoverState
+from .spatial_index import SpatialIndex, contains_point
+from .text_layer import TextLayer, CENTERED
+from .static_layer import StaticLayer
+from .move_preview import MovePreview
+from .profiler import PROFILER, profiled
+from .profile_overlay import ProfileOverlay
+from .events import (
+    TILE_PLACED,
+    TILE_REMOVED,
+    BOARD_SET,
+    RACK_CHANGED,
+    RACK_REORDERED,
+    SCORE_CHANGED,
+    TURN_ADVANCED,
+    BAG_CHANGED,
+)
 from .board import EMPTY_TILES
-from .utils import to_coords, get_rack_position, get_board_position
+from .utils import (
+    get_rack_position,
+    get_board_position,
+    get_rack_index,
+    get_board_square,
+    tile_counts_to_str,
+)
 from .game_manager import GameManager
 from .player import Player
 from .ai import AI
 
 
-# suppress warning for too many attributes
-# pylint: disable=R0902
+# suppress warning for too many attributes and public methods
+# pylint: disable=R0902,R0904
 class ScrabbleUI(arcade.View):
     """
     Class representing the Scrabble UI
@@ -32,14 +58,17 @@ class ScrabbleUI(arcade.View):
 
     # suppress warning for too many statements
     # pylint: disable=R0915
-    def __init__(self, players: list[str, str]):
+    def __init__(self, players: list[str, str], lexicon_id: str = "default"):
         super().__init__()
 
         # default background
         self.bg: str = "pattern"
 
+        # the background the window background sprite currently shows
+        self.shown_bg: str = self.bg
+
         # initialize game manager
-        self.game_manager = GameManager(players)
+        self.game_manager = GameManager(players, lexicon_id)
 
         # For displaying the game history
         self.game_history: dict[Player : list[int]] = {}
@@ -47,6 +76,16 @@ class ScrabbleUI(arcade.View):
         for player in self.game_manager.get_player_list():
             self.game_history[player] = []
 
+        # The player whose unseen tiles are shown, the last human to have a turn
+        self.viewing_player: Player = next(
+            (
+                player
+                for player in self.game_manager.get_player_list()
+                if not isinstance(player, AI)
+            ),
+            self.game_manager.get_player_list()[0],
+        )
+
         # for determining the current held tile
         self.held_tile: Tile = None
         self.held_tile_index: int = -1
@@ -71,9 +110,19 @@ class ScrabbleUI(arcade.View):
         self.game_over = False
 
         """ Sprites creation for graphics """
-        # displays the current board state
+        # every sprite list draws from the window's atlas, so pack the tile and button images first
+        TEXTURES.pack(self.window.ctx.default_atlas)
+
+        # displays the current board state, one sprite per square in row order
         self.board_sprites: arcade.SpriteList = arcade.SpriteList()
 
+        # the image each board sprite currently shows
+        self.board_images: list[list[str]] = [
+            [None for _ in range(SIZE)] for _ in range(SIZE)
+        ]
+
+        self.create_board_sprites()
+
         # displays player's rack
         self.rack_sprites: arcade.SpriteList = arcade.SpriteList()
 
@@ -84,7 +133,7 @@ class ScrabbleUI(arcade.View):
         for i, name in enumerate(button_names):
             self.button_sprites.append(
                 arcade.Sprite(
-                    f"./assets/images/{name}_button.png",
+                    get_texture(f"./assets/images/{name}_button.png"),
                     center_x=BUTTON_X,
                     center_y=BORDER_Y * (1.1 - (i * 0.2)),
                 )
@@ -92,7 +141,7 @@ class ScrabbleUI(arcade.View):
 
         self.button_sprites.append(
             arcade.Sprite(
-                "./assets/images/settings_button.png",
+                get_texture("./assets/images/settings_button.png"),
                 center_x=WINDOW_WIDTH - 120,
                 center_y=WINDOW_HEIGHT - 50,
             )
@@ -100,7 +149,7 @@ class ScrabbleUI(arcade.View):
 
         self.button_sprites.append(
             arcade.Sprite(
-                "./assets/images/exit.png",
+                get_texture("./assets/images/exit.png"),
                 center_x=WINDOW_WIDTH - 50,
                 center_y=WINDOW_HEIGHT - 50,
             )
@@ -109,39 +158,39 @@ class ScrabbleUI(arcade.View):
         self.background_sprites: arcade.SpriteList = arcade.SpriteList()
 
         window_background = arcade.Sprite(
-            BACKGROUNDS["gray"],
+            get_texture(BACKGROUNDS[self.bg]),
             center_x=WINDOW_WIDTH // 2,
             center_y=WINDOW_HEIGHT // 2,
         )
         window_background.size = (WINDOW_WIDTH, WINDOW_HEIGHT)
 
         board_background = arcade.Sprite(
-            "./assets/images/background.png",
+            get_texture("./assets/images/background.png"),
             center_x=BACKGROUND_COORDS["board"][0],
             center_y=BACKGROUND_COORDS["board"][1],
         )
         board_background.size = (BOARD_SIZE * 1.15, BOARD_SIZE * 1.15)
 
         turn_display = arcade.Sprite(
-            "./assets/images/turn_display.png",
+            get_texture("./assets/images/turn_display.png"),
             center_x=BACKGROUND_COORDS["turn_display"][0],
             center_y=BACKGROUND_COORDS["turn_display"][1],
         )
 
         scoreboard_background = arcade.Sprite(
-            "./assets/images/scoreboard_background.png",
+            get_texture("./assets/images/scoreboard_background.png"),
             center_x=BACKGROUND_COORDS["scoreboard"][0],
             center_y=BACKGROUND_COORDS["scoreboard"][1],
         )
 
         letter_dist_background = arcade.Sprite(
-            "./assets/images/scoreboard_background.png",
+            get_texture("./assets/images/scoreboard_background.png"),
             center_x=BACKGROUND_COORDS["letter_dist"][0],
             center_y=BACKGROUND_COORDS["letter_dist"][1],
         )
 
         rack_background = arcade.Sprite(
-            "./assets/images/rack.png",
+            get_texture("./assets/images/rack.png"),
             center_x=BACKGROUND_COORDS["rack"][0],
             center_y=BACKGROUND_COORDS["rack"][1],
         )
@@ -156,21 +205,7 @@ class ScrabbleUI(arcade.View):
         # Displays background image options
         self.bg_images = arcade.SpriteList()
 
-        bg_data = [
-            {"key": "scrabble", "offset": (-150, 20)},
-            {"key": "gray", "offset": (-150, -80)},
-            {"key": "starry", "offset": (0, 20)},
-            {"key": "mountains", "offset": (150, 20)},
-            {"key": "pattern", "offset": (0, -80)},
-            {"key": "games", "offset": (150, -80)},
-        ]
-
-        for bg in bg_data:
-            sprite = arcade.Sprite(BACKGROUNDS[bg["key"]])
-            sprite.size = (WINDOW_WIDTH * 0.1, WINDOW_HEIGHT * 0.1)
-            sprite.center_x = BOARD_CENTER_X + bg["offset"][0]
-            sprite.center_y = BOARD_CENTER_Y + bg["offset"][1]
-            self.bg_images.append(sprite)
+        self.create_background_previews()
 
         (
             self.scrabble_img,
@@ -182,119 +217,233 @@ class ScrabbleUI(arcade.View):
         ) = self.bg_images
 
         # Displays all text
-        self.text_objects: list[arcade.Text] = []
         arcade.load_font("./assets/Minecraft.ttf")
+        self.text_layer: TextLayer = TextLayer(
+            color=arcade.color.WHITE, font_name="Minecraft"
+        )
+
+        # Titles which never change are drawn with the backgrounds
+        self.static_texts: TextLayer = TextLayer(
+            color=arcade.color.WHITE, font_size=18, font_name="Minecraft", **CENTERED
+        )
+        self.static_texts.set_text(
+            "scoreboard",
+            "Scoreboard",
+            BACKGROUND_COORDS["scoreboard"][0] - 70,
+            BACKGROUND_COORDS["scoreboard"][1] + 240,
+        )
+        self.static_texts.set_text(
+            "unseen",
+            "Unseen Tiles",
+            BACKGROUND_COORDS["letter_dist"][0],
+            BACKGROUND_COORDS["letter_dist"][1] + 240,
+        )
+
+        # The backgrounds, board and titles, drawn offscreen and only redrawn when they change
+        self.static_layer: StaticLayer = StaticLayer(
+            self.window,
+            [self.background_sprites, self.board_sprites, self.static_texts],
+        )
 
         # For displaying pop up messages
         self.popup: arcade.Sprite = arcade.Sprite(
-            "./assets/images/turn_display.png",
+            get_texture("./assets/images/turn_display.png"),
             center_x=BOARD_CENTER_X,
             center_y=BOARD_CENTER_Y,
         )
         self.popup.size = (WINDOW_WIDTH // 3, WINDOW_HEIGHT // 3)
 
         self.done_button: arcade.Sprite = arcade.Sprite(
-            "./assets/images/trade_in_button.png",
+            get_texture("./assets/images/trade_in_button.png"),
             center_x=BOARD_CENTER_X,
             center_y=BOARD_CENTER_Y - 100,
         )
 
+        # The text of each popup, kept for the whole game
+        self.popup_texts: dict[str, TextLayer] = {}
+        self.create_popup_texts()
+
+        # The normal and hover textures of each button which changes color under the mouse
+        self.button_textures: dict[arcade.Sprite, tuple[arcade.Texture, ...]] = {}
+        self.create_button_textures()
+
+        # Finds the buttons and background previews under the mouse
+        self.button_index: SpatialIndex = SpatialIndex()
+        for sprite in self.button_sprites:
+            self.button_index.add(sprite)
+        self.button_index.add(self.done_button)
+
+        self.preview_index: SpatialIndex = SpatialIndex()
+        for sprite in self.bg_images:
+            self.preview_index.add(sprite)
+
+        # The button and rack tile under the mouse
+        self.button_hover: HoverState = HoverState(
+            self.highlight_button, self.unhighlight_button
+        )
+        self.rack_hover: HoverState = HoverState(
+            self.lift_rack_tile, self.lower_rack_tile
+        )
+
+        # The parts of the display whose game state changed since they were last updated
+        self.dirty_displays: set[str] = set()
+        self.display_updates: dict[str, Callable[[], None]] = {
+            "board": self.update_board_display,
+            "rack": self.update_rack_display,
+            "turn": self.update_turn_text,
+            "scores": self.update_score_text,
+            "unseen": self.update_unseen_text,
+            "preview": self.update_preview_text,
+        }
+
+        # Preview of the move being placed, worked out again as tiles are placed
+        self.move_preview: MovePreview = MovePreview(self.game_manager.get_board())
+        self.subscribe_to_game()
+
+        # Profiling overlay, toggled with F3
+        self.profile_overlay: ProfileOverlay = ProfileOverlay(PROFILER)
+
         self.update_displays()
         self.next_turn()
 
+    @profiled
     def on_mouse_motion(self, x, y, dx, dy):
         """
         Called whenever the mouse moves.
         """
 
         # Make tiles move up slightly to indicate the player hovering over them
-        if self.background_sprites[5].collides_with_point((x, y)):
-            for i, sprite in enumerate(self.rack_sprites):
-                if sprite.collides_with_point((x, y)):
-                    new_y = get_rack_position(i)[1] + 20
-                    sprite.center_y = new_y
-                else:
-                    _, original_y = get_rack_position(i)
-                    sprite.center_y = original_y
+        self.rack_hover.set_hovered(self.get_rack_index_at(x, y))
 
-        image_names = [
-            "play_word_button",
-            "reset_button",
-            "shuffle_button",
-            "trade_in_button",
-            "settings_button",
-        ]
         # Change button colors to indicate player hovering over them
-        for i, sprite in enumerate(self.button_sprites[:-1]):
-            if sprite.collides_with_point((x, y)):
-                sprite.texture = arcade.load_texture(
-                    f"./assets/images/{image_names[i]}_hover.png"
-                )
-            else:
-                sprite.texture = arcade.load_texture(
-                    f"./assets/images/{image_names[i]}.png"
-                )
-
-        if self.done_button.collides_with_point((x, y)):
-            self.done_button.texture = arcade.load_texture(
-                "./assets/images/trade_in_button_hover.png"
-            )
-        else:
-            self.done_button.texture = arcade.load_texture(
-                "./assets/images/trade_in_button.png"
-            )
+        hovered_button = self.button_index.get_sprite_at(x, y)
+        if hovered_button not in self.button_textures:
+            hovered_button = None
+        self.button_hover.set_hovered(hovered_button)
 
         if self.held_tile:
             self.held_tile.sprite.center_x = x
             self.held_tile.sprite.center_y = y
             # Adjust scale based on whether tile is over the board
             if (
-                self.background_sprites[1].collides_with_point((x, y))
+                contains_point(self.background_sprites[1], x, y)
                 and not self.trade_in_active
             ):
                 self.held_tile.sprite.scale = 0.63
             else:
                 self.held_tile.sprite.scale = 1.2
 
+    def create_background_previews(self):
+        """
+        Creates the background previews of the settings popup from downscaled copies,
+        so the full size backgrounds are only loaded once they are chosen
+        """
+        bg_data = [
+            {"key": "scrabble", "offset": (-150, 20)},
+            {"key": "gray", "offset": (-150, -80)},
+            {"key": "starry", "offset": (0, 20)},
+            {"key": "mountains", "offset": (150, 20)},
+            {"key": "pattern", "offset": (0, -80)},
+            {"key": "games", "offset": (150, -80)},
+        ]
+
+        preview_size = (int(WINDOW_WIDTH * 0.1), int(WINDOW_HEIGHT * 0.1))
+        for bg in bg_data:
+            sprite = arcade.Sprite(
+                TEXTURES.get_thumbnail(BACKGROUNDS[bg["key"]], preview_size)
+            )
+            sprite.size = (WINDOW_WIDTH * 0.1, WINDOW_HEIGHT * 0.1)
+            sprite.center_x = BOARD_CENTER_X + bg["offset"][0]
+            sprite.center_y = BOARD_CENTER_Y + bg["offset"][1]
+            self.bg_images.append(sprite)
+
+    def create_button_textures(self):
+        """Loads the normal and hover textures of the buttons which change color"""
+        image_names = [
+            "play_word_button",
+            "reset_button",
+            "shuffle_button",
+            "trade_in_button",
+            "settings_button",
+        ]
+        for sprite, name in zip(self.button_sprites, image_names):
+            self.button_textures[sprite] = (
+                get_texture(f"./assets/images/{name}.png"),
+                get_texture(f"./assets/images/{name}_hover.png"),
+            )
+        self.button_textures[self.done_button] = (
+            get_texture("./assets/images/trade_in_button.png"),
+            get_texture("./assets/images/trade_in_button_hover.png"),
+        )
+
+    def get_rack_index_at(self, x, y) -> int | None:
+        """Returns the index of the rack tile shown at a screen position, None if there is none"""
+        index = get_rack_index(x, len(self.rack_sprites))
+        if index is None or not contains_point(self.rack_sprites[index], x, y):
+            return None
+        return index
+
+    def get_board_square_at(self, x, y) -> tuple[int, int] | None:
+        """Returns the board square shown at a screen position, None if there is none"""
+        # board sprites are drawn 7 pixels left of their board position
+        return get_board_square(x + 7, y, self.board_sprites[0].width / 2)
+
+    def highlight_button(self, sprite: arcade.Sprite):
+        """Shows the hover texture of a button"""
+        sprite.texture = self.button_textures[sprite][1]
+
+    def unhighlight_button(self, sprite: arcade.Sprite):
+        """Shows the normal texture of a button"""
+        sprite.texture = self.button_textures[sprite][0]
+
+    def lift_rack_tile(self, index: int):
+        """Moves a rack tile up slightly"""
+        self.rack_sprites[index].center_y = get_rack_position(index)[1] + 20
+
+    def lower_rack_tile(self, index: int):
+        """Moves a lifted rack tile back into the rack"""
+        if index < len(self.rack_sprites):
+            self.rack_sprites[index].center_y = get_rack_position(index)[1]
+
     # suppress warning for too many branches
     # pylint: disable=R0912
     def on_mouse_press(self, x, y, button, modifiers):
         """
         Called when the user presses a mouse button.
         """
+        self.refresh_displays()
+
         # Check if a rack tile was clicked
         if not isinstance(self.game_manager.get_current_turn_player(), AI) and not (
             self.reading_blank_input or self.game_over
         ):
-            for i, tile in enumerate(
-                self.game_manager.get_current_turn_player().get_rack_tiles()
-            ):
-                if tile.sprite.collides_with_point((x, y)):
-                    self.held_tile = tile
-                    self.held_tile_index = i
-                    break
+            index = self.get_rack_index_at(x, y)
+            if index is not None:
+                self.held_tile = (
+                    self.game_manager.get_current_turn_player().get_rack_tiles()[index]
+                )
+                self.held_tile_index = index
 
         if not (self.trade_in_active or self.reading_blank_input or self.game_over):
             # Check if a button was clicked
-            for i, sprite in enumerate(self.button_sprites):
-                if sprite.collides_with_point((x, y)):
-                    if i == 0:
-                        self.play_turn()
-                    elif i == 1:
-                        self.reset_turn()
-                    elif i == 2:
-                        self.shuffle_rack()
-                    elif i == 3:
-                        self.trade_in()
-                    elif i == 4:
-                        self.settings()
-                    elif i == 5:
-                        arcade.close_window()
-        elif self.done_button.collides_with_point((x, y)):
+            sprite = self.button_index.get_sprite_at(x, y)
+            if sprite is not None and sprite in self.button_sprites:
+                i = self.button_sprites.index(sprite)
+                if i == 0:
+                    self.play_turn()
+                elif i == 1:
+                    self.reset_turn()
+                elif i == 2:
+                    self.shuffle_rack()
+                elif i == 3:
+                    self.trade_in()
+                elif i == 4:
+                    self.settings()
+                elif i == 5:
+                    arcade.close_window()
+        elif contains_point(self.done_button, x, y):
             if self.trade_in_active:
-                self.game_manager.get_current_turn_player().refill_rack(
-                    self.game_manager.get_drawbag()
-                )
+                self.game_manager.trade_tiles(self.tiles_to_trade)
                 self.game_history[self.game_manager.get_current_turn_player()].append(0)
 
                 if len(self.tiles_to_trade) == 0:
@@ -313,87 +462,77 @@ class ScrabbleUI(arcade.View):
                 "pattern",
                 "games",
             ]
-            for i, sprite in enumerate(self.bg_images):
-                if sprite.collides_with_point((x, y)):
-                    self.bg = bgs[i]
-                    self.update_background_display()
-                    break
+            sprite = self.preview_index.get_sprite_at(x, y)
+            if sprite is not None:
+                self.bg = bgs[self.bg_images.index(sprite)]
+                self.update_background_display()
 
     def on_mouse_release(self, x, y, button, modifiers):
         """
         Called when a user releases a mouse button.
         """
+        self.refresh_displays()
+
         if self.held_tile:
             placed = False
 
             # If a tile is dropped over a space on the board, update the board position to that tile
-            for i, board_sprite in enumerate(self.board_sprites):
-                if board_sprite.collides_with_point((x, y)) and not (
-                    self.trade_in_active or self.reading_blank_input or self.game_over
-                ):
-                    col, row = to_coords(i)
+            square = None
+            if not (self.trade_in_active or self.reading_blank_input or self.game_over):
+                square = self.get_board_square_at(x, y)
 
-                    # ensure tiles can only be played on empty board tiles
-                    if self.game_manager.get_board().get_tile_at(
-                        row, col
-                    ) not in EMPTY_TILES or isinstance(
-                        self.game_manager.get_current_turn_player(), AI
-                    ):
-                        continue
-
-                    new_tile = Tile.copy(self.held_tile)
-
-                    if new_tile.letter == "":  # This is a blank tile
-
-                        # Prompt user to select a letter for the blank tile
-                        self.reading_blank_input = True
-                        self.blank_tile_position = (row, col)
+            # ensure tiles can only be played on empty board tiles
+            if (
+                square is not None
+                and self.game_manager.get_board().get_tile_at(*square) in EMPTY_TILES
+                and not isinstance(self.game_manager.get_current_turn_player(), AI)
+            ):
+                row, col = square
+                new_tile = Tile.copy(self.held_tile)
 
-                        # Update display
-                        self.update_rack_display()
-                    else:
-                        self.game_manager.get_board().update_tile(row, col, new_tile)
+                if new_tile.letter == "":  # This is a blank tile
 
-                    board_sprite.texture = arcade.load_texture(new_tile.image_path)
+                    # Prompt user to select a letter for the blank tile
+                    self.reading_blank_input = True
+                    self.blank_tile_position = (row, col)
+                else:
+                    self.game_manager.get_board().update_tile(row, col, new_tile)
 
-                    # Remove the tile from player's rack
-                    self.game_manager.get_current_turn_player().get_rack().remove_tile(
-                        self.game_manager.get_current_turn_player().get_rack_tiles()[
-                            self.held_tile_index
-                        ]
-                    )
+                self.board_sprites[row * SIZE + col].texture = get_texture(
+                    new_tile.image_path
+                )
+                self.board_images[row][col] = new_tile.image_path
+                self.static_layer.invalidate()
 
-                    # Update the rack display
-                    self.update_rack_display()
+                # Remove the tile from player's rack
+                self.game_manager.get_current_turn_player().get_rack().remove_tile(
+                    self.game_manager.get_current_turn_player().get_rack_tiles()[
+                        self.held_tile_index
+                    ]
+                )
 
-                    placed = True
-                    break
+                placed = True
 
             if not placed and self.trade_in_active:
-                if self.popup.collides_with_point((x, y)) and self.held_tile:
+                if contains_point(self.popup, x, y) and self.held_tile:
                     self.game_manager.get_current_turn_player().get_rack().remove_tile(
                         self.held_tile
                     )
                     self.tiles_to_trade.append(self.held_tile)
-                    self.update_rack_display()
+                    self.update_popup_texts()
                     placed = True
 
             # Allow for dragging tiles onto one another in the rack to swap their positions
             if not placed:
-                curr_rack = self.game_manager.get_current_turn_player().get_rack_tiles()
-                for i, rack_tile in enumerate(curr_rack):
-                    if (
-                        rack_tile != self.held_tile
-                        and rack_tile.sprite.collides_with_point((x, y))
-                    ):
-                        curr_rack[self.held_tile_index], curr_rack[i] = (
-                            curr_rack[i],
-                            curr_rack[self.held_tile_index],
-                        )
-
-                        self.update_displays()
-                        placed = True
-                        break
+                curr_rack = self.game_manager.get_current_turn_player().get_rack()
+                index = get_rack_index(x, curr_rack.len_rack())
+                if (
+                    index is not None
+                    and index != self.held_tile_index
+                    and contains_point(curr_rack.get_rack()[index].sprite, x, y)
+                ):
+                    curr_rack.swap(self.held_tile_index, index)
+                    placed = True
 
             # If the tile is not dragged to a valid spot on the board, reset it back to rack
             if not placed and not self.held_tile_index == -1:
@@ -405,224 +544,179 @@ class ScrabbleUI(arcade.View):
             self.held_tile = None
             self.held_tile_index = -1
 
+            # the dropped tile has been put back, so lift whichever tile the mouse is over again
+            self.rack_hover.forget()
+
+    @profiled
     def on_draw(self):
         """
         Render the screen.
         """
+        PROFILER.frame()
+        self.refresh_displays()
+
         # This command should happen before we start drawing. It will clear
         # the screen to the background color, and erase what we drew last frame.
         self.clear()
 
-        # Call draw() on all sprite lists below
-        self.background_sprites.draw()
-        self.board_sprites.draw()
+        # Show the static layer, then draw everything which can change between frames
+        self.static_layer.draw()
         self.button_sprites.draw()
 
-        for text_object in self.text_objects:
-            text_object.draw()
+        self.text_layer.draw()
 
         self.draw_popups()
 
         self.rack_sprites.draw()
 
+        if self.profile_overlay.visible:
+            self.profile_overlay.draw(self.get_object_counts())
+
+    def get_object_counts(self) -> dict[str, int]:
+        """Returns the number of sprites and text objects the view draws"""
+        sprite_lists = [
+            self.background_sprites,
+            self.board_sprites,
+            self.rack_sprites,
+            self.button_sprites,
+            self.bg_images,
+        ]
+        text_layers = [self.text_layer, self.static_texts, *self.popup_texts.values()]
+
+        return {
+            "sprites": sum(len(sprite_list) for sprite_list in sprite_lists) + 2,
+            "texts": sum(len(text_layer) for text_layer in text_layers),
+        }
+
     def draw_popups(self):
         """Draws any popups which are currently active"""
         # Draw blank tile prompt if active
         if self.reading_blank_input:
             arcade.draw_sprite(self.popup)
-            arcade.Text(
-                "Select a letter for the blank tile:",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 25,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "(Press any letter key)",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y - 25,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
+            self.popup_texts["blank"].draw()
 
         if self.bingo:
             arcade.draw_sprite(self.popup)
-            arcade.Text(
-                "BINGO! +50 points",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 50,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "All 7 tiles used!",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "Press ESC to close",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y - 50,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
+            self.popup_texts["bingo"].draw()
 
         if self.trade_in_active:
             arcade.draw_sprite(self.popup)
-            arcade.Text(
-                "Drag tiles here to trade in.",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 30,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "Tiles chosen: "
-                + ", ".join(
-                    [
-                        ("blank" if tile.letter == "" else tile.letter)
-                        for tile in self.tiles_to_trade
-                    ]
-                ),
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "(Press ESC to cancel)",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y - 30,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
             arcade.draw_sprite(self.done_button)
-            arcade.Text(
-                "Done",
-                self.done_button.center_x,
-                self.done_button.center_y,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
+            self.popup_texts["trade_in"].draw()
 
         if self.game_over:
             arcade.draw_sprite(self.popup)
-            arcade.Text(
-                "Game Over!",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 120,
-                arcade.color.WHITE,
-                24,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "Final Scores:",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 80,
-                arcade.color.WHITE,
-                18,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            for i, player in enumerate(self.game_manager.get_player_list()):
-                arcade.Text(
-                    f"{player.get_name()}: {player.get_score()} points",
-                    BOARD_CENTER_X,
-                    BOARD_CENTER_Y + 40 - (25 * i),
-                    arcade.color.WHITE,
-                    14,
-                    align="center",
-                    anchor_x="center",
-                    anchor_y="center",
-                    font_name="Minecraft",
-                ).draw()
-
             arcade.draw_sprite(self.done_button)
+            self.popup_texts["game_over"].draw()
 
-            arcade.Text(
-                "Done",
-                self.done_button.center_x,
-                self.done_button.center_y,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
         if self.settings_active:
             arcade.draw_sprite(self.popup)
-            arcade.Text(
-                "Click to change background",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 120,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
-            arcade.Text(
-                "(Press ESC when done)",
-                BOARD_CENTER_X,
-                BOARD_CENTER_Y + 90,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ).draw()
+            self.popup_texts["settings"].draw()
             self.bg_images.draw()
 
+    def create_popup_texts(self):
+        """Creates the text of every popup, which is kept for the whole game"""
+        for name in ["blank", "bingo", "trade_in", "game_over", "settings"]:
+            self.popup_texts[name] = TextLayer(
+                color=arcade.color.WHITE,
+                font_size=16,
+                font_name="Minecraft",
+                **CENTERED,
+            )
+
+        blank = self.popup_texts["blank"]
+        blank.set_text(
+            "prompt",
+            "Select a letter for the blank tile:",
+            BOARD_CENTER_X,
+            BOARD_CENTER_Y + 25,
+        )
+        blank.set_text(
+            "hint", "(Press any letter key)", BOARD_CENTER_X, BOARD_CENTER_Y - 25
+        )
+
+        bingo = self.popup_texts["bingo"]
+        bingo.set_text(
+            "title", "BINGO! +50 points", BOARD_CENTER_X, BOARD_CENTER_Y + 50
+        )
+        bingo.set_text("tiles", "All 7 tiles used!", BOARD_CENTER_X, BOARD_CENTER_Y)
+        bingo.set_text(
+            "hint", "Press ESC to close", BOARD_CENTER_X, BOARD_CENTER_Y - 50
+        )
+
+        trade_in = self.popup_texts["trade_in"]
+        trade_in.set_text(
+            "prompt",
+            "Drag tiles here to trade in.",
+            BOARD_CENTER_X,
+            BOARD_CENTER_Y + 30,
+        )
+        trade_in.set_text("chosen", "Tiles chosen: ", BOARD_CENTER_X, BOARD_CENTER_Y)
+        trade_in.set_text(
+            "hint", "(Press ESC to cancel)", BOARD_CENTER_X, BOARD_CENTER_Y - 30
+        )
+
+        game_over = self.popup_texts["game_over"]
+        game_over.set_text(
+            "title", "Game Over!", BOARD_CENTER_X, BOARD_CENTER_Y + 120, font_size=24
+        )
+        game_over.set_text(
+            "scores", "Final Scores:", BOARD_CENTER_X, BOARD_CENTER_Y + 80, font_size=18
+        )
+
+        for layer in (trade_in, game_over):
+            layer.set_text(
+                "done", "Done", self.done_button.center_x, self.done_button.center_y
+            )
+
+        settings = self.popup_texts["settings"]
+        settings.set_text(
+            "title", "Click to change background", BOARD_CENTER_X, BOARD_CENTER_Y + 120
+        )
+        settings.set_text(
+            "hint", "(Press ESC when done)", BOARD_CENTER_X, BOARD_CENTER_Y + 90
+        )
+
+    @profiled
+    def update_popup_texts(self):
+        """Updates the popup text which depends on the game state"""
+        self.popup_texts["trade_in"].set_text(
+            "chosen",
+            "Tiles chosen: "
+            + ", ".join(
+                [
+                    ("blank" if tile.letter == "" else tile.letter)
+                    for tile in self.tiles_to_trade
+                ]
+            ),
+            BOARD_CENTER_X,
+            BOARD_CENTER_Y,
+        )
+
+        if self.game_over:
+            for i, player in enumerate(self.game_manager.get_player_list()):
+                self.popup_texts["game_over"].set_text(
+                    ("score", i),
+                    f"{player.get_name()}: {player.get_score()} points",
+                    BOARD_CENTER_X,
+                    BOARD_CENTER_Y + 40 - (25 * i),
+                    font_size=14,
+                )
+
     def on_key_press(self, symbol, modifiers):
         """
         Handle keyboard input for blank tile letter selection
         """
+        if symbol == arcade.key.F3:
+            self.profile_overlay.toggle()
+            return
+        if symbol == arcade.key.F4:
+            self.profile_overlay.export()
+            return
+        if symbol == arcade.key.F5:
+            self.game_manager.reload_lexicon()
+            return
+
         if self.reading_blank_input:
             if 97 <= symbol <= 122:
                 letter = chr(symbol).lower()
@@ -631,8 +725,6 @@ class ScrabbleUI(arcade.View):
                 new_tile = Tile(letter, 0, f"./assets/images/{letter}.png")
                 self.game_manager.get_board().update_tile(row, col, new_tile)
 
-                self.update_board_display()
-
                 self.reading_blank_input = False
                 self.blank_tile_position = None
                 return
@@ -658,7 +750,7 @@ class ScrabbleUI(arcade.View):
         Confirms the played turn's legality and performs
         the logic needed to finish a played turn
         """
-        is_valid, words, is_bingo = self.game_manager.get_board().play_turn()
+        is_valid, words, is_bingo = self.game_manager.play_turn()
         if is_valid:
             score = sum(words.values())
 
@@ -676,9 +768,7 @@ class ScrabbleUI(arcade.View):
             ):
                 self.end_game()
             else:
-                self.game_manager.get_current_turn_player().refill_rack(
-                    self.game_manager.get_drawbag()
-                )
+                self.game_manager.refill_rack()
 
                 self.skip_count = 0
                 self.next_turn()
@@ -690,10 +780,22 @@ class ScrabbleUI(arcade.View):
         Calls the appropriate methods for an AI
         to choose and then play a turn
         """
-        if self.game_manager.get_current_turn_player().choose_move():
+        player = self.game_manager.get_current_turn_player()
+        chosen = player.choose_move()
+
+        stats = player.last_turn_stats
+        if PROFILER.enabled and stats:
+            PROFILER.record(
+                "ai_turn",
+                stats["generation_ms"] + stats["validation_ms"] + stats["scoring_ms"],
+                player=player.get_name(),
+                **stats,
+            )
+
+        if chosen:
             self.play_turn()
         else:
-            self.skip_turn()
+            self.skip_turn(player)
 
     def reset_turn(self):
         """Reset the current turn"""
@@ -706,9 +808,6 @@ class ScrabbleUI(arcade.View):
         )
         self.game_manager.get_board().clear_current_turn_tiles()
 
-        self.update_board_display()
-        self.update_rack_display()
-
         # Clear any held tile
         self.held_tile = None
         self.held_tile_index = -1
@@ -717,25 +816,32 @@ class ScrabbleUI(arcade.View):
         """Trade in any number (incl. 0) of tiles for new ones and end your turn"""
         self.reset_turn()
         self.trade_in_active = True
+        self.update_popup_texts()
 
     def settings(self):
         """Display settings"""
         self.reset_turn()
         self.settings_active = True
 
-    def skip_turn(self):
-        """Skips the current turn without playing a word or drawing new tiles"""
+    def skip_turn(self, searched: Player = None):
+        """
+        Skips the current turn without playing a word or drawing new tiles,
+        where searched is an AI whose search just found no move
+        """
         self.skip_count += 1
 
-        if self.skip_count == len(self.game_manager.get_player_list()) * 2:
+        if self.skip_count == len(
+            self.game_manager.get_player_list()
+        ) * 2 or self.game_manager.is_stuck(searched):
             self.end_game()
         else:
             self.next_turn()
 
     def shuffle_rack(self):
         """Shuffles the current player's rack"""
-        random.shuffle(self.game_manager.get_current_turn_player().get_rack_tiles())
-        self.update_displays()
+        self.game_manager.get_current_turn_player().get_rack().shuffle(
+            self.game_manager.get_shuffle_rng()
+        )
 
     def next_turn(self):
         """
@@ -745,44 +851,105 @@ class ScrabbleUI(arcade.View):
         self.trade_in_active = False
         self.tiles_to_trade.clear()
         self.game_manager.next_turn()
-        self.update_displays()
+        if not isinstance(self.game_manager.get_current_turn_player(), AI):
+            self.viewing_player = self.game_manager.get_current_turn_player()
         if isinstance(self.game_manager.get_current_turn_player(), AI):
             arcade.schedule_once(lambda _: self.computer_turn(), 0.1)
 
     def end_game(self):
         """Ends the game"""
-        self.update_displays()
         self.game_manager.end_game()
         self.game_over = True
+        self.update_popup_texts()
+        self.invalidate_displays("preview")
 
     def update_displays(self):
-        """Calls all 3 update methods"""
+        """Updates every part of the display"""
         self.update_board_display()
         self.update_rack_display()
         self.update_text_display()
         self.update_background_display()
+        self.dirty_displays.clear()
+
+    def subscribe_to_game(self):
+        """Subscribes each part of the display to the game events which change it"""
+        board = self.game_manager.get_board()
+        for event in (TILE_PLACED, TILE_REMOVED, BOARD_SET):
+            board.subscribe(
+                event, lambda *_: self.invalidate_displays("board", "preview")
+            )
 
-    def update_board_display(self):
-        """Update the visual representation of the board to match the current board state"""
-        # Clear existing board sprites
-        self.board_sprites.clear()
+        for player in self.game_manager.get_player_list():
+            player.subscribe(
+                SCORE_CHANGED, lambda *_: self.invalidate_displays("scores")
+            )
+            rack = player.get_rack()
+            rack.subscribe(RACK_CHANGED, lambda *_: self.invalidate_displays("rack"))
+            rack.subscribe(RACK_REORDERED, lambda *_: self.invalidate_displays("rack"))
+
+        # a new turn shows another rack, the last turn's history
+        # and possibly another player's unseen tiles
+        self.game_manager.subscribe(
+            TURN_ADVANCED,
+            lambda *_: self.invalidate_displays(
+                "turn", "rack", "scores", "unseen", "preview"
+            ),
+        )
+        self.game_manager.subscribe(TURN_ADVANCED, lambda *_: self.move_preview.clear())
+        self.game_manager.subscribe(
+            BAG_CHANGED, lambda *_: self.invalidate_displays("unseen")
+        )
 
-        # Create new sprites for each tile on the board
-        current_board = self.game_manager.get_board().get_board()
+    def invalidate_displays(self, *names: str):
+        """Marks parts of the display to be updated before they are next used"""
+        self.dirty_displays.update(names)
+
+    def refresh_displays(self):
+        """Updates only the parts of the display whose game state changed"""
+        if not self.dirty_displays:
+            return
+
+        dirty = self.dirty_displays
+        self.dirty_displays = set()
+        for name, update in self.display_updates.items():
+            if name in dirty:
+                update()
+
+    def create_board_sprites(self):
+        """Creates the sprite for every board square, which are kept for the whole game"""
         for row in range(SIZE):
             for col in range(SIZE):
-                _tile = current_board[row][col]
-                tile = Tile(_tile.letter, _tile.value, _tile.image_path)
-
                 x, y = get_board_position(row, col)
-                tile.sprite.center_x = x - 7
-                tile.sprite.center_y = y
+                self.board_sprites.append(
+                    arcade.Sprite(
+                        get_texture(EMPTY_TILES[0].image_path),
+                        0.63,
+                        center_x=x - 7,
+                        center_y=y,
+                    )
+                )
+
+    @profiled
+    def update_board_display(self):
+        """
+        Update the visual representation of the board to match the current board state,
+        changing only the sprites of squares the board reports as changed
+        """
+        current_board = self.game_manager.get_board().get_board()
 
-                self.board_sprites.append(tile.sprite)
+        for row, col in self.game_manager.get_board().take_changed_squares():
+            image_path = current_board[row][col].image_path
 
+            if self.board_images[row][col] != image_path:
+                self.board_sprites[row * SIZE + col].texture = get_texture(image_path)
+                self.board_images[row][col] = image_path
+                self.static_layer.invalidate()
+
+    @profiled
     def update_rack_display(self):
         """Update the visual representation of the rack to match the player's rack"""
         # Clear existing rack tiles and positions (except rack graphic)
+        self.rack_hover.forget()
         while not len(self.rack_sprites) == 0:
             self.rack_sprites.pop()
 
@@ -798,153 +965,153 @@ class ScrabbleUI(arcade.View):
                 if tile.sprite not in self.rack_sprites:
                     self.rack_sprites.append(tile.sprite)
 
+    @profiled
     def update_text_display(self):
         """Update the visual representation of the score and history to match the game state"""
-        self.text_objects = []
-
-        turn_text = self.game_manager.get_current_turn_player().get_name() + "'s turn!"
-
-        self.text_objects = [
-            arcade.Text(
-                turn_text,
-                BACKGROUND_COORDS["turn_display"][0],
-                BACKGROUND_COORDS["turn_display"][1] - 65,
-                arcade.color.WHITE,
-                22,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Scoreboard",
-                BACKGROUND_COORDS["scoreboard"][0] - 70,
-                BACKGROUND_COORDS["scoreboard"][1] + 240,
-                arcade.color.WHITE,
-                18,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Play Word",
-                BUTTON_X,
-                self.button_sprites.sprite_list[0].center_y - 6,
-                arcade.color.WHITE,
-                14,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Reset",
-                BUTTON_X,
-                self.button_sprites.sprite_list[1].center_y - 6,
-                arcade.color.WHITE,
-                14,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Shuffle",
-                BUTTON_X,
-                self.button_sprites.sprite_list[2].center_y - 6,
-                arcade.color.WHITE,
-                14,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Trade In",
+        for i, label in enumerate(["Play Word", "Reset", "Shuffle", "Trade In"]):
+            self.text_layer.set_text(
+                label,
+                label,
                 BUTTON_X,
-                self.button_sprites.sprite_list[3].center_y - 6,
-                arcade.color.WHITE,
-                14,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                "Letter Distribution",
-                BACKGROUND_COORDS["letter_dist"][0],
-                BACKGROUND_COORDS["letter_dist"][1] + 240,
-                arcade.color.WHITE,
-                18,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-            arcade.Text(
-                LETTER_DIST,
-                BACKGROUND_COORDS["letter_dist"][0] - 100,
-                BACKGROUND_COORDS["letter_dist"][1] + 200,
-                arcade.color.WHITE,
-                14,
-                align="center",
-                font_name="Minecraft",
-                width=205,
-                multiline=True,
-            ),
-            arcade.Text(
-                f"Tiles Remaining: {self.game_manager.get_drawbag().get_remaining_tiles()}",
-                BACKGROUND_COORDS["letter_dist"][0],
-                BACKGROUND_COORDS["letter_dist"][1] - 240,
-                arcade.color.WHITE,
-                16,
-                align="center",
-                anchor_x="center",
-                anchor_y="center",
-                font_name="Minecraft",
-            ),
-        ]
+                self.button_sprites.sprite_list[i].center_y - 6,
+                font_size=14,
+                **CENTERED,
+            )
+
+        self.update_turn_text()
+        self.update_score_text()
+        self.update_unseen_text()
+        self.update_preview_text()
+
+    @profiled
+    def update_turn_text(self):
+        """Update the text showing whose turn it is"""
+        self.text_layer.set_text(
+            "turn",
+            self.game_manager.get_current_turn_player().get_name() + "'s turn!",
+            BACKGROUND_COORDS["turn_display"][0],
+            BACKGROUND_COORDS["turn_display"][1] - 65,
+            font_size=22,
+            **CENTERED,
+        )
 
+    @profiled
+    def update_preview_text(self):
+        """
+        Update the text previewing the move being placed, with its score and
+        words if it is legal, or why not, hiding it when no tiles are placed
+        """
+        layer = self.text_layer
+        if (
+            self.game_over
+            or isinstance(self.game_manager.get_current_turn_player(), AI)
+            or len(self.game_manager.get_board().get_current_turn_tiles()) == 0
+        ):
+            layer.hide("preview")
+            layer.hide("preview_words")
+            return
+
+        is_valid, words, is_bingo = self.move_preview.get_preview()
+        invalid_words = self.move_preview.get_invalid_words()
+        if is_valid:
+            score = sum(words.values()) + (is_bingo * 50)
+            headline = f"{score} points" + (" with a bingo!" if is_bingo else "")
+            details = "   ".join(
+                f"{word.upper()} {score}" for word, score in words.items()
+            )
+        elif invalid_words:
+            headline = "Not a word:"
+            details = ", ".join(word.upper() for word in invalid_words)
+        else:
+            headline = "Not a valid play"
+            details = "Tiles must form one line joined to the board"
+
+        layer.set_text(
+            "preview",
+            headline,
+            BACKGROUND_COORDS["scoreboard"][0],
+            BACKGROUND_COORDS["rack"][1] + 20,
+            font_size=18,
+            **CENTERED,
+        )
+        layer.set_text(
+            "preview_words",
+            details,
+            BACKGROUND_COORDS["scoreboard"][0],
+            BACKGROUND_COORDS["rack"][1] - 15,
+            font_size=14,
+            **CENTERED,
+        )
+
+    @profiled
+    def update_unseen_text(self):
+        """Update the text showing the viewing player's unseen tiles and the draw bag"""
+        layer = self.text_layer
+        layer.set_text(
+            "unseen",
+            tile_counts_to_str(self.viewing_player.get_unseen().get_counts()),
+            BACKGROUND_COORDS["letter_dist"][0] - 100,
+            BACKGROUND_COORDS["letter_dist"][1] + 200,
+            font_size=14,
+            align="center",
+            width=205,
+            multiline=True,
+        )
+        layer.set_text(
+            "remaining",
+            f"Tiles Remaining: {self.game_manager.get_drawbag().get_remaining_tiles()}",
+            BACKGROUND_COORDS["letter_dist"][0],
+            BACKGROUND_COORDS["letter_dist"][1] - 240,
+            font_size=16,
+            **CENTERED,
+        )
+
+    @profiled
+    def update_score_text(self):
+        """Update the text showing each player's score and turn history"""
+        layer = self.text_layer
         turns_shown = 20 // len(self.game_manager.get_player_list())
         offset = 20 * (1 + turns_shown)
 
         for i, player in enumerate(self.game_manager.get_player_list()):
-            self.text_objects.append(
-                arcade.Text(
-                    f"{player.get_name()}:   {player.get_score()}",
-                    BACKGROUND_COORDS["scoreboard"][0] - 140,
-                    BACKGROUND_COORDS["scoreboard"][1] + 210 - (offset * i),
-                    arcade.color.WHITE,
-                    14,
-                    font_name="Minecraft",
-                )
+            layer.set_text(
+                ("score", i),
+                f"{player.get_name()}:   {player.get_score()}",
+                BACKGROUND_COORDS["scoreboard"][0] - 140,
+                BACKGROUND_COORDS["scoreboard"][1] + 210 - (offset * i),
+                font_size=14,
             )
 
-            for j, score in enumerate(
-                reversed(self.game_history[player][-turns_shown:])
-            ):
-                self.text_objects.append(
-                    arcade.Text(
-                        f"Turn {len(self.game_history[player]) - j}: +{score}",
-                        BACKGROUND_COORDS["scoreboard"][0] + 50,
-                        BACKGROUND_COORDS["scoreboard"][1]
-                        + 210
-                        - (offset * i)
-                        - (20 * (j + 1)),
-                        arcade.color.WHITE,
-                        12,
-                        font_name="Minecraft",
-                    )
+            # each player shows their last few turns, so the number of texts never grows
+            history = self.game_history[player][-turns_shown:]
+            for j in range(turns_shown):
+                if j >= len(history):
+                    layer.hide(("history", i, j))
+                    continue
+
+                layer.set_text(
+                    ("history", i, j),
+                    f"Turn {len(self.game_history[player]) - j}: +{history[-1 - j]}",
+                    BACKGROUND_COORDS["scoreboard"][0] + 50,
+                    BACKGROUND_COORDS["scoreboard"][1]
+                    + 210
+                    - (offset * i)
+                    - (20 * (j + 1)),
+                    font_size=12,
                 )
 
+    @profiled
     def update_background_display(self):
-        """Update the background display based on the selected background"""
-        window_background = arcade.Sprite(
-            BACKGROUNDS[self.bg],
-            center_x=WINDOW_WIDTH // 2,
-            center_y=WINDOW_HEIGHT // 2,
-        )
+        """
+        Update the background display based on the selected background,
+        reusing the window background sprite and only changing it when another is chosen
+        """
+        if self.shown_bg == self.bg:
+            return
+
+        window_background = self.background_sprites[0]
+        window_background.texture = get_texture(BACKGROUNDS[self.bg])
         window_background.size = (WINDOW_WIDTH, WINDOW_HEIGHT)
 
-        self.background_sprites[0] = window_background
+        self.shown_bg = self.bg
+        self.static_layer.invalidate()
@@ -0,0 +1,66 @@
+"""Module containing the definition for a SpatialIndex object"""
+
+import math
+from .config import arcade
+
+# The size of the grid cells the index buckets sprites into, in pixels
+CELL_SIZE = 128
+
+
+def contains_point(sprite: arcade.Sprite, x: float, y: float) -> bool:
+    """Returns whether a screen position is within the bounding box of an unrotated sprite"""
+    return (
+        abs(x - sprite.center_x) <= sprite.width / 2
+        and abs(y - sprite.center_y) <= sprite.height / 2
+    )
+
+
+class SpatialIndex:
+    """
+    Class which finds the sprite at a screen position by bucketing
+    the bounding boxes of sprites into a coarse grid, for widgets which
+    are not laid out on a regular grid like the board and rack
+
+    Attributes:
+        cell_size (float): The width and height of each grid cell
+        cells (dict((int, int), list(arcade.Sprite))): The sprites overlapping each grid cell,
+            in the order they were added
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        self.cell_size: float = cell_size
+        self.cells: dict[tuple[int, int], list[arcade.Sprite]] = {}
+
+    def get_cells(self, sprite: arcade.Sprite) -> list[tuple[int, int]]:
+        """Returns the grid cells the bounding box of a sprite overlaps"""
+        left = math.floor((sprite.center_x - sprite.width / 2) / self.cell_size)
+        right = math.floor((sprite.center_x + sprite.width / 2) / self.cell_size)
+        bottom = math.floor((sprite.center_y - sprite.height / 2) / self.cell_size)
+        top = math.floor((sprite.center_y + sprite.height / 2) / self.cell_size)
+
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(left, right + 1)
+            for cell_y in range(bottom, top + 1)
+        ]
+
+    def add(self, sprite: arcade.Sprite):
+        """Adds a sprite to the index at its current position and size"""
+        for cell in self.get_cells(sprite):
+            self.cells.setdefault(cell, []).append(sprite)
+
+    def remove(self, sprite: arcade.Sprite):
+        """Removes a sprite from the index, which must not have moved since it was added"""
+        for cell in self.get_cells(sprite):
+            self.cells[cell].remove(sprite)
+
+    def get_sprite_at(self, x: float, y: float) -> arcade.Sprite | None:
+        """
+        Returns the first sprite added whose hit box holds a screen position, or None,
+        only testing the hit boxes of sprites whose bounding box holds the position
+        """
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        for sprite in self.cells.get(cell, ()):
+            if contains_point(sprite, x, y) and sprite.collides_with_point((x, y)):
+                return sprite
+        return None
@@ -1,7 +1,7 @@
 """Module containing the definition for a StartScreen object"""
 
 import arcade
-from .config import arcade, WINDOW_WIDTH, WINDOW_HEIGHT
+from .config import arcade, WINDOW_WIDTH, WINDOW_HEIGHT, DICTIONARY
 from .scrabble_ui import ScrabbleUI
 
 
@@ -38,20 +38,37 @@ class StartScreen(arcade.View):
         title_text.center_y = WINDOW_HEIGHT / 2 + 50
         self.sprites.append(title_text)
 
-        start_text = arcade.create_text_sprite(
-            "Press any key to start", arcade.color.WHITE, 20
+        # Shows dictionary loading progress until the game is ready to start
+        self.start_text: arcade.Text = arcade.Text(
+            "",
+            WINDOW_WIDTH / 2,
+            WINDOW_HEIGHT / 2 - 50,
+            arcade.color.WHITE,
+            20,
+            anchor_x="center",
+            anchor_y="center",
         )
-        start_text.center_x = WINDOW_WIDTH / 2
-        start_text.center_y = WINDOW_HEIGHT / 2 - 50
-        self.sprites.append(start_text)
+        self.on_update(0)
+
+    def on_update(self, delta_time):
+        """Update the loading progress shown on the start screen."""
+        if DICTIONARY.is_ready():
+            self.start_text.text = "Press any key to start"
+        else:
+            self.start_text.text = (
+                f"Loading dictionary... {int(DICTIONARY.progress * 100)}%"
+            )
 
     def on_draw(self):
         """Render the start screen."""
         self.clear()
 
         self.sprites.draw()
+        self.start_text.draw()
 
     def on_key_press(self, symbol, modifiers):
+        # Waits for the dictionary only if it is still loading
+        DICTIONARY.get()
         self.start_game()
 
     def start_game(self):
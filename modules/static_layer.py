@@ -0,0 +1,61 @@
+"""Module containing the definition for a StaticLayer object"""
+
+from arcade.gl import Framebuffer, Geometry, geometry
+from .config import arcade
+
+
+class StaticLayer:
+    """
+    Class which draws the parts of the screen that rarely change into an
+    offscreen framebuffer, and then shows them every frame as a single quad
+
+    The framebuffer is only drawn again after the layer is invalidated,
+    or when the window has changed size
+
+    Attributes:
+        window (arcade.Window): The window the layer is shown in
+        layers (list): The sprite lists and text layers drawn into the framebuffer, in order
+        framebuffer (Framebuffer): The framebuffer holding the layer, None until it is first drawn
+        quad (Geometry): A quad covering the whole screen, for showing the framebuffer
+        valid (bool): Whether the framebuffer matches the layers
+    """
+
+    def __init__(self, window: arcade.Window, layers: list):
+        self.window: arcade.Window = window
+        self.layers: list = layers
+        self.framebuffer: Framebuffer = None
+        self.quad: Geometry = geometry.quad_2d_fs()
+        self.valid: bool = False
+
+    def invalidate(self):
+        """Marks the layer to be drawn again before it is next shown"""
+        self.valid = False
+
+    def render(self):
+        """Draws every layer into the framebuffer, creating it at the window's size if needed"""
+        ctx = self.window.ctx
+        size = self.window.get_framebuffer_size()
+
+        if self.framebuffer is None or self.framebuffer.size != size:
+            self.framebuffer = ctx.framebuffer(color_attachments=[ctx.texture(size)])
+
+        with self.framebuffer.activate():
+            self.framebuffer.clear()
+            for layer in self.layers:
+                layer.draw()
+
+        self.valid = True
+
+    def draw(self):
+        """Shows the layer, drawing it into the framebuffer first if it has changed"""
+        if (
+            not self.valid
+            or self.framebuffer.size != self.window.get_framebuffer_size()
+        ):
+            self.render()
+
+        # the layer is opaque, so it is copied to the screen without blending
+        ctx = self.window.ctx
+        self.framebuffer.color_attachments[0].use(0)
+        with ctx.enabled_only():
+            self.quad.render(ctx.utility_textured_quad_program)
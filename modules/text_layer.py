@@ -0,0 +1,58 @@
+"""Module containing the definition for a TextLayer object"""
+
+from collections.abc import Hashable
+import pyglet
+from .config import arcade
+
+# Style for text centered on its position
+CENTERED = {"align": "center", "anchor_x": "center", "anchor_y": "center"}
+
+
+class TextLayer:
+    """
+    Class which keeps the text objects of part of the screen alive between frames
+    and draws them all at once through a single pyglet batch
+
+    Each text is created the first time it is set and afterwards only changed
+    when its string or position differs, so drawing the layer allocates nothing
+    however often its texts are set
+
+    Attributes:
+        batch (pyglet.graphics.Batch): The batch every text of the layer is drawn through
+        texts (dict(Hashable, arcade.Text)): The texts of the layer by key
+        style (dict): The style used for every text unless it is overridden
+    """
+
+    def __init__(self, **style):
+        self.batch: pyglet.graphics.Batch = pyglet.graphics.Batch()
+        self.texts: dict[Hashable, arcade.Text] = {}
+        self.style: dict = style
+
+    def set_text(self, key: Hashable, text: str, x: float, y: float, **style):
+        """
+        Shows a string at a position under a key, creating the text with the
+        layer's style and any overrides the first time the key is set
+        """
+        if key not in self.texts:
+            self.texts[key] = arcade.Text(
+                text, x, y, batch=self.batch, **(self.style | style)
+            )
+            return
+
+        text_object = self.texts[key]
+        if text_object.text != text:
+            text_object.text = text
+        if text_object.x != x or text_object.y != y:
+            text_object.position = (x, y)
+
+    def hide(self, key: Hashable):
+        """Hides the text under a key by emptying it, keeping it for when it is set again"""
+        if key in self.texts and self.texts[key].text != "":
+            self.texts[key].text = ""
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def draw(self):
+        """Draws every text of the layer"""
+        self.batch.draw()
@@ -0,0 +1,99 @@
+"""Module containing the definition for a TextureRegistry object"""
+
+import os
+from PIL import Image
+from arcade.texture_atlas import TextureAtlasBase
+from .config import arcade, THUMBNAIL_CACHE_DIR
+
+IMAGE_DIR = "./assets/images"
+
+# Images no larger than this on either side are packed into the atlas up front,
+# which covers the letter, premium square and button images but not the backgrounds
+ATLAS_IMAGE_LIMIT = 128
+
+
+class TextureRegistry:
+    """
+    Class which loads each image once and hands out the same texture
+    to every sprite showing it
+
+    Sprites sharing a texture share its region of the texture atlas, so the
+    images are only decoded and uploaded once however often they are shown
+
+    Attributes:
+        textures (dict(str, arcade.Texture)): The loaded textures by normalized file path,
+            including the downscaled copies of images
+        atlas (TextureAtlasBase): The atlas the small images were packed into,
+            None until they are packed
+    """
+
+    def __init__(self):
+        self.textures: dict[str, arcade.Texture] = {}
+        self.atlas: TextureAtlasBase = None
+
+    def get(self, path: str) -> arcade.Texture:
+        """Returns the texture of an image file, loading it the first time it is asked for"""
+        key = os.path.normpath(path)
+        if key not in self.textures:
+            self.textures[key] = arcade.load_texture(key)
+        return self.textures[key]
+
+    def get_thumbnail(
+        self, path: str, size: tuple[int, int], cache_dir: str = THUMBNAIL_CACHE_DIR
+    ) -> arcade.Texture:
+        """
+        Returns the texture of a downscaled copy of an image file, only decoding the
+        full image when the copy in the cache directory is missing or older than it
+        """
+        width, height = size
+        name = os.path.splitext(os.path.basename(path))[0]
+        thumbnail_path = os.path.join(cache_dir, f"{name}_{width}x{height}.png")
+
+        if os.path.normpath(thumbnail_path) not in self.textures and (
+            not os.path.exists(thumbnail_path)
+            or os.path.getmtime(thumbnail_path) < os.path.getmtime(path)
+        ):
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{thumbnail_path}.{os.getpid()}.tmp"
+            with Image.open(path) as image:
+                image.resize(size, Image.Resampling.LANCZOS).save(temp_path, "PNG")
+            os.replace(temp_path, thumbnail_path)
+
+        return self.get(thumbnail_path)
+
+    def preload(self, directory: str = IMAGE_DIR) -> list[arcade.Texture]:
+        """
+        Loads every PNG in a directory small enough for the atlas, reading only
+        the header of the larger ones so they are still loaded when first shown
+        """
+        small: list[arcade.Texture] = []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".png"):
+                continue
+
+            path = os.path.join(directory, name)
+            with Image.open(path) as image:
+                if max(image.size) > ATLAS_IMAGE_LIMIT:
+                    continue
+            small.append(self.get(path))
+        return small
+
+    def pack(self, atlas: TextureAtlasBase, directory: str = IMAGE_DIR):
+        """
+        Packs the letter, premium square and button images into an atlas,
+        so the board, rack and buttons all draw from the same atlas texture
+        """
+        if self.atlas is atlas:
+            return
+
+        for texture in self.preload(directory):
+            atlas.add(texture)
+        self.atlas = atlas
+
+
+TEXTURES = TextureRegistry()
+
+
+def get_texture(path: str) -> arcade.Texture:
+    """Returns the shared texture of an image file"""
+    return TEXTURES.get(path)
@@ -1,6 +1,7 @@
 """Module that contains the definition for a Tile object"""
 
 from .config import arcade
+from .textures import get_texture
 
 
 class Tile:
@@ -30,7 +31,7 @@ class Tile:
         self.coords: tuple[int, int] = None
 
         # Create a sprite for rendering tile graphics
-        self.sprite: arcade.Sprite = arcade.Sprite(image_path)
+        self.sprite: arcade.Sprite = arcade.Sprite(get_texture(image_path))
         self.sprite.scale = self.scale
 
     @classmethod
@@ -97,3 +98,23 @@ TILES = {
     "z": Tile("z", 10, "./assets/images/z.png"),
     "blank": Tile("", 0, "./assets/images/clear.png"),
 }
+
+# Racks and draw bags count their tiles in one slot per letter, blanks last
+BLANK_SLOT = 26
+SLOT_KEYS = [chr(ord("a") + slot) for slot in range(BLANK_SLOT)] + ["blank"]
+SLOT_VALUES = [TILES[key].value for key in SLOT_KEYS]
+
+
+def letter_slot(letter: str) -> int:
+    """Returns the count slot of a letter, the empty letter being a blank"""
+    return BLANK_SLOT if letter == "" else ord(letter) - ord("a")
+
+
+def tile_slot(tile: Tile) -> int:
+    """Returns the count slot of a tile, counting any tile worth nothing as a blank"""
+    return BLANK_SLOT if tile.value == 0 else letter_slot(tile.letter)
+
+
+def slot_tile(slot: int) -> Tile:
+    """Creates a new tile for a count slot"""
+    return Tile.copy(TILES[SLOT_KEYS[slot]])
@@ -0,0 +1,77 @@
+"""Module containing the definition for an UnseenTiles object"""
+
+from .drawbag import Drawbag
+from .rack import RACK_SIZE
+from .tile import Tile, SLOT_KEYS, tile_slot
+
+SLOTS = range(len(SLOT_KEYS))
+
+
+class UnseenTiles(Drawbag):
+    """
+    Class tracking the tiles one player has not seen, which are the tiles
+    left in the draw bag together with the tiles on every opponent's rack
+
+    It starts as a full draw bag and loses each tile the player draws or
+    sees played by an opponent, so its counts are always up to date
+
+    Attributes:
+        counts (list(int)): The number of unseen tiles of each letter,
+            indexed by count slot with blanks in the last slot
+        size (int): The total number of unseen tiles
+        rng (random.Random): The generator racks are sampled with, derived from
+            the game's so sampling never changes the tiles drawn in the game
+    """
+
+    def see_slots(self, slots: list[int]):
+        """Removes tiles the player has just seen by count slot"""
+        for slot in slots:
+            self.counts[slot] -= 1
+        self.size -= len(slots)
+        self.pool = None
+
+    def see_tiles(self, tiles: list[Tile]):
+        """Removes tiles the player has just seen"""
+        self.see_slots([tile_slot(tile) for tile in tiles])
+
+    def return_tiles(self, tiles: list[Tile]):
+        """Adds back tiles the player has put back into the draw bag"""
+        for tile in tiles:
+            self.add_tile(tile)
+
+    def sample_rack(
+        self, k: int = RACK_SIZE, weights: list[float] = None, rng=None
+    ) -> list[int]:
+        """
+        Returns the count slots of a plausible opponent rack drawn from the
+        unseen tiles, without changing them
+
+        weights scales how likely each count slot is to be on the rack, for
+        example by last_play_weights, otherwise every unseen tile is equally likely
+        """
+        if weights is None:
+            return self.sample(k, rng)
+
+        rng = rng or self.rng
+        counts = self.counts[:]
+        slots: list[int] = []
+
+        for _ in range(min(k, self.size)):
+            slot = rng.choices(
+                SLOTS, [count * weight for count, weight in zip(counts, weights)]
+            )[0]
+            counts[slot] -= 1
+            slots.append(slot)
+
+        return slots
+
+
+def last_play_weights(played: list[int], factor: float = 0.5) -> list[float]:
+    """
+    Returns sampling weights for an opponent's rack after they played the given
+    count slots, making letters they chose to play less likely to be kept
+    """
+    weights = [1.0] * len(SLOTS)
+    for slot in played:
+        weights[slot] = factor
+    return weights
@@ -1,12 +1,10 @@
 """Module containing utility functions for other modules"""
 
 from typing import Tuple
-from itertools import permutations, combinations
 
 from .config import (
     SIZE,
     DICTIONARY,
-    ALPHABET,
     BOARD_START_X,
     BOARD_START_Y,
     TILE_SIZE,
@@ -14,7 +12,8 @@ from .config import (
     RACK_TILE_SPACING,
     BACKGROUND_COORDS,
 )
-from .tile import Tile
+from .tile import Tile, SLOT_KEYS
+from .lexicon import Lexicon
 
 
 def to_coords(index: int) -> Tuple[int, int]:
@@ -41,9 +40,52 @@ def get_rack_position(tile_index):
     return x, y
 
 
-def valid_word(word: str) -> bool:
-    """Retruns True if the word exists in the dictionary, false otherwise"""
-    return DICTIONARY.has_key(word)
+def get_board_square(x, y, half_size: float = TILE_SIZE / 2):
+    """
+    Returns the row and column of the board tile at a screen position, or None if there is none,
+    by inverting get_board_position and checking the point is within half_size of the tile's center
+    """
+    step = TILE_SIZE + TILE_GAP
+    col = round((x - BOARD_START_X) / step)
+    row = SIZE - 1 - round((y - BOARD_START_Y) / step)
+    if not (0 <= row < SIZE and 0 <= col < SIZE):
+        return None
+
+    center_x, center_y = get_board_position(row, col)
+    if abs(x - center_x) > half_size or abs(y - center_y) > half_size:
+        return None
+    return row, col
+
+
+def get_rack_index(x, tile_count: int):
+    """
+    Returns the index of the rack tile whose position is nearest to a screen x position,
+    or None if it is past either end of the rack, by inverting get_rack_position
+    """
+    index = round((x - BOARD_START_X) / RACK_TILE_SPACING)
+    if not 0 <= index < tile_count:
+        return None
+    return index
+
+
+def valid_word(word: str, lexicon: Lexicon = None) -> bool:
+    """
+    Retruns True if the word exists in the lexicon, false otherwise
+    The default dictionary is used if no lexicon is passed
+    """
+    if lexicon is None:
+        lexicon = DICTIONARY.get()
+    return lexicon.is_word(word)
+
+
+def valid_words(words, lexicon: Lexicon = None) -> list[bool]:
+    """
+    Returns whether each of the given words exists in the lexicon
+    The default dictionary is used if no lexicon is passed
+    """
+    if lexicon is None:
+        lexicon = DICTIONARY.get()
+    return lexicon.valid_words(words)
 
 
 def tiles_to_str(tiles: list[Tile]) -> str:
@@ -51,7 +93,9 @@ def tiles_to_str(tiles: list[Tile]) -> str:
     return "".join([(tile.letter if tile.letter != "blank" else "_") for tile in tiles])
 
 
-def get_possible_words(input_string: str = "", num_free_letters: int = 0) -> list[str]:
+def get_possible_words(
+    input_string: str = "", num_free_letters: int = 0, lexicon: Lexicon = None
+) -> list[str]:
     """
     Gets valid words that can be formed with the given letters (tiles)
     Can be used for AI to decide a move for them to play
@@ -59,62 +103,13 @@ def get_possible_words(input_string: str = "", num_free_letters: int = 0) -> lis
     Attributes:
         input_string (str): collection of letters to find valid words for
         num_free_letters (int): the number of free letters (blank tiles) to add to the search
+        lexicon (Lexicon): the lexicon to search, the default dictionary if None
     Returns:
         list of all valid words that can be formed from the given letters/tiles
     """
-
-    def get_permutations(s) -> set[str]:
-        return set("".join(p) for p in permutations(s))
-
-    words: set[str] = set()
-
-    free_letter_combinations: set[str] = set()
-    if num_free_letters > 0:
-        for free_letters in combinations(ALPHABET, num_free_letters):
-            free_letter_combinations.add("".join(free_letters))
-    else:
-        free_letter_combinations.add("")
-
-    for free_letters in free_letter_combinations:
-        available_letters = input_string + free_letters
-
-        n = len(available_letters)
-        for length in range(2, n + 1):
-            for subset in combinations(available_letters, length):
-                subset_str = "".join(subset)
-                for perm in get_permutations(subset_str):
-                    if valid_word(perm):
-                        words.add(perm)
-
-    return list(words)
-
-
-def find_permutations_recursive(
-    remaining_letters: list[str], words: list[str], substr: str = ""
-):
-    """
-    Recursively navigates the dictionary by character
-    to find all permutations of remaining_letters
-    """
-    if valid_word(substr) and substr not in words:
-        words.append(substr)
-
-    if remaining_letters == "":
-        return words
-    for i, letter in enumerate(remaining_letters):
-        if DICTIONARY.has_subtrie(substr + letter):
-            find_permutations_recursive(
-                remaining_letters[:i] + remaining_letters[i + 1 :],
-                words,
-                substr + letter,
-            )
-        elif letter == "":
-            for edge in DICTIONARY.iterkeys(substr, True):
-                find_permutations_recursive(
-                    remaining_letters.remove(letter), words, substr + edge[0]
-                )
-
-    return words
+    if lexicon is None:
+        lexicon = DICTIONARY.get()
+    return lexicon.anagrams(input_string, num_free_letters)
 
 
 def copy_list(original: list) -> list:
@@ -127,3 +122,18 @@ def copy_list(original: list) -> list:
         copy.append(obj)
 
     return copy
+
+
+def tile_counts_to_str(counts: list[int]) -> str:
+    """
+    Formats the number of tiles in each count slot as three columns of
+    letters, for displaying the letter distribution
+    """
+    labels = [key.upper() if len(key) == 1 else key.title() for key in SLOT_KEYS]
+    entries = [f"{label} - {count}" for label, count in zip(labels, counts)]
+    rows = [
+        "   ".join(entry.ljust(7) for entry in entries[row::9]).rstrip()
+        for row in range(9)
+    ]
+
+    return "\n---------------------------\n".join(rows)
@@ -0,0 +1,24 @@
+"""Shared setup for the tests, run from the repository root without a display"""
+
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# config asks arcade for the display size, and assets are loaded by relative path
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+
+# suppress warning for importing after setting up the environment, which config needs
+# pylint: disable=C0413
+from modules import opening_book
+
+
+@pytest.fixture(autouse=True)
+def book_dir(tmp_path, monkeypatch):
+    """Keeps the opening books of each test in its own temporary directory"""
+    monkeypatch.setattr(opening_book, "LEXICON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(opening_book, "OPENING_BOOKS", {})
+    return tmp_path
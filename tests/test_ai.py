@@ -0,0 +1,77 @@
+"""Tests for the AI's move search and stuck game detection"""
+
+from modules.game_manager import GameManager
+from modules.tile import Tile, TILES
+
+
+def play_word(game_manager: GameManager, word: str, row: int, col: int):
+    """Plays a word across from row, col onto the board"""
+    board = game_manager.get_board()
+    for i, letter in enumerate(word):
+        board.update_tile(row, col + i, Tile.copy(TILES[letter]))
+    assert board.play_turn()[0]
+
+
+def set_racks(game_manager: GameManager, letters: str):
+    """Empties the draw bag and gives every player a rack of the given letters"""
+    drawbag = game_manager.get_drawbag()
+    while not drawbag.is_empty():
+        drawbag.draw_slot()
+
+    for player in game_manager.get_player_list():
+        player.get_rack().set_rack([Tile.copy(TILES[letter]) for letter in letters])
+
+
+def test_extending_a_word_is_a_legal_move():
+    """A word can be extended along its own line, such as "ox" into "cox" """
+    game_manager = GameManager([("ai", "a"), ("ai", "b")], seed=1)
+    play_word(game_manager, "ox", 7, 6)
+    set_racks(game_manager, "c")
+
+    searcher = game_manager.get_player_list()[0]
+    moves = [
+        [(tile.letter, coords) for tile, coords in move]
+        for move in searcher.iter_moves()
+        if game_manager.get_board().test_turn(move)[0]
+    ]
+
+    assert [("c", (7, 5))] in moves
+    assert searcher.has_legal_move()
+    assert not game_manager.is_stuck()
+
+
+def test_game_with_a_human_is_never_stuck():
+    """A search never ends the game for a human's rack"""
+    game_manager = GameManager([("human", "a"), ("ai", "b")], seed=1)
+    play_word(game_manager, "ox", 7, 6)
+    set_racks(game_manager, "q")
+
+    assert not game_manager.is_stuck()
+
+
+def test_ai_game_without_moves_is_stuck():
+    """A game between AIs ends once none of them can place a word"""
+    game_manager = GameManager([("ai", "a"), ("ai", "b")], seed=1)
+    play_word(game_manager, "ox", 7, 6)
+    set_racks(game_manager, "q")
+
+    assert game_manager.is_stuck()
+
+
+def test_stuck_check_skips_the_rack_just_searched():
+    """The rack whose search just failed is not searched again"""
+    game_manager = GameManager([("ai", "a"), ("ai", "b")], seed=1)
+    play_word(game_manager, "ox", 7, 6)
+    set_racks(game_manager, "q")
+    searcher = game_manager.get_player_list()[0]
+
+    searched_racks = []
+    has_legal_move = searcher.has_legal_move
+
+    def counting_search(rack=None):
+        searched_racks.append(rack)
+        return has_legal_move(rack)
+
+    searcher.has_legal_move = counting_search
+    assert game_manager.is_stuck(game_manager.get_current_turn_player())
+    assert not searched_racks
@@ -0,0 +1,29 @@
+"""Tests for the board's cross-check sets"""
+
+from modules.game_manager import GameManager
+from modules.lexicon import letter_mask
+
+
+def cross_check_masks(board) -> list[list[list[int]]]:
+    """Returns the letter masks of every cross-check set on a board"""
+    return [
+        [[letter_mask(cross_check) for cross_check in row] for row in cross_checks]
+        for cross_checks in (board.cross_checks_across, board.cross_checks_down)
+    ]
+
+
+def test_rebuild_matches_incremental_cross_checks():
+    """Rebuilding the cross-checks gives the sets updated after each move"""
+    game_manager = GameManager([("ai", "a"), ("ai", "b")], seed=3)
+    board = game_manager.get_board()
+
+    for _ in range(12):
+        player = game_manager.get_current_turn_player()
+        if player.choose_move():
+            board.play_turn()
+            game_manager.refill_rack()
+        game_manager.next_turn()
+
+        updated = cross_check_masks(board)
+        board.rebuild_cross_checks()
+        assert cross_check_masks(board) == updated
@@ -0,0 +1,49 @@
+"""Tests for sampling and copying the draw bag"""
+
+import random
+from modules.drawbag import Drawbag
+from modules.game_manager import GameManager
+from modules.unseen import UnseenTiles
+
+
+def draw_sequence(drawbag: Drawbag, count: int = 20) -> list[int]:
+    """Returns the count slots of the next tiles drawn from a draw bag"""
+    return [drawbag.draw_slot() for _ in range(count)]
+
+
+def test_sampling_leaves_the_seeded_draws_unchanged():
+    """Sampling racks and copies of the bag never changes the tiles the game draws"""
+    drawn = []
+    for sample in (False, True):
+        game_manager = GameManager([("ai", "a"), ("ai", "b")], seed=5)
+        drawbag = game_manager.get_drawbag()
+        if sample:
+            for player in game_manager.get_player_list():
+                player.get_unseen().sample_rack()
+            draw_sequence(drawbag.copy())
+        drawn.append(draw_sequence(drawbag))
+
+    assert drawn[0] == drawn[1]
+
+
+def test_copy_keeps_the_class_and_its_own_generator():
+    """A copy is of the same class as the bag and draws with its own generator"""
+    unseen = UnseenTiles(random.Random(1))
+    copy = unseen.copy()
+
+    assert isinstance(copy, UnseenTiles)
+    assert copy.get_rng() is not unseen.get_rng()
+    assert copy.get_counts() == unseen.get_counts()
+
+
+def test_shuffling_leaves_the_seeded_draws_unchanged():
+    """Shuffling a rack never changes the tiles the game draws"""
+    drawn = []
+    for shuffle in (False, True):
+        game_manager = GameManager([("human", "a"), ("ai", "b")], seed=5)
+        if shuffle:
+            for player in game_manager.get_player_list():
+                player.get_rack().shuffle(game_manager.get_shuffle_rng())
+        drawn.append(draw_sequence(game_manager.get_drawbag()))
+
+    assert drawn[0] == drawn[1]
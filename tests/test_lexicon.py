@@ -0,0 +1,48 @@
+"""Tests for word lookups in a lexicon"""
+
+from modules.lexicon import Lexicon, LexiconRegistry
+
+
+def test_word_table_matches_the_word_list():
+    """Compiled and rebuilt lexicons find exactly their own words"""
+    words = ["a", "ab", "abs", "cab", "cabs", "scab"]
+    compiled = Lexicon(words)
+    rebuilt = Lexicon.from_buffer(compiled.to_bytes())
+    queries = words + ["", "b", "abc", "cabss", "scabs", "é"]
+
+    for lexicon in (compiled, rebuilt):
+        assert lexicon.valid_words(queries) == [query in words for query in queries]
+    # looking words up must not decode the shared word list
+    # suppress warning for accessing a protected member
+    # pylint: disable=W0212
+    assert rebuilt._words is None
+
+
+def test_registry_loads_without_a_usable_cache(tmp_path):
+    """A cache directory that cannot be created only means compiling the word list"""
+    path = tmp_path / "words.txt"
+    path.write_text("cat\ndog\n", encoding="utf-8")
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+
+    registry = LexiconRegistry({}, str(blocker / "cache"), 1 << 30)
+    assert registry.get(str(path)).is_word("dog")
+
+
+def test_reload_patches_then_compiles_the_word_list(tmp_path):
+    """A reload applies the changed words and then replaces the patch in full"""
+    path = tmp_path / "words.txt"
+    path.write_text("cat\ndog\ncow\n", encoding="utf-8")
+    registry = LexiconRegistry({}, str(tmp_path / "cache"), 1 << 30)
+    old = registry.get(str(path))
+
+    path.write_text("cat\ncow\ncows\n", encoding="utf-8")
+    patched = old.patched(*old.diff(["cat", "cow", "cows"]))
+    assert patched.words == ["cat", "cow", "cows"]
+    assert patched.back_hooks_of("cow") == 1 << (ord("s") - 97)
+
+    assert registry.apply_reload(str(path))
+    latest = registry.peek(str(path))
+    assert latest.base is None
+    assert latest.valid_words(["cows", "dog"]) == [True, False]
+    assert old.is_word("dog")
@@ -0,0 +1,61 @@
+"""Tests for storing first moves in an opening book"""
+
+import struct
+from modules.lexicon import Lexicon
+from modules.opening_book import (
+    OpeningBook,
+    BOOK_HEADER,
+    BOOK_SAVE_INTERVAL,
+    KEY_SIZE,
+    get_opening_book,
+)
+
+
+def rack_key(i: int) -> bytes:
+    """Returns a distinct rack key for each i"""
+    return bytes([i]) * KEY_SIZE
+
+
+def test_book_of_unregistered_lexicon_is_kept():
+    """A lexicon not loaded through a registry keeps its book between calls"""
+    lexicon = Lexicon(["cat", "act"])
+    get_opening_book(lexicon).add(b"act", [None])
+
+    assert get_opening_book(lexicon).get(b"act") == [None]
+    assert get_opening_book(Lexicon(["cat"])).get(b"act") is None
+
+
+def test_book_is_saved_every_few_racks(tmp_path):
+    """Racks are written to the file in batches and read back from it"""
+    path = str(tmp_path / "moves.book")
+    book = OpeningBook(path)
+    for i in range(BOOK_SAVE_INTERVAL):
+        book.add(rack_key(i), [(3, "cat", i), None])
+
+    assert not book.added
+    book.add(rack_key(255), [None])
+    assert book.save()
+
+    reopened = OpeningBook(path)
+    assert len(reopened) == BOOK_SAVE_INTERVAL + 1
+    assert reopened.get(rack_key(5)) == [(3, "cat", 5), None]
+    assert reopened.get(rack_key(255)) == [None]
+
+
+def test_unwritable_book_keeps_its_racks(tmp_path):
+    """A book whose file cannot be written keeps its racks in memory"""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    book = OpeningBook(str(blocker / "moves.book"))
+    book.add(b"act", [None])
+
+    assert not book.save()
+    assert book.get(b"act") == [None]
+
+
+def test_book_from_another_version_is_ignored(tmp_path):
+    """A book written for another version of the move search is not replayed"""
+    path = tmp_path / "moves.book"
+    path.write_bytes(BOOK_HEADER.pack(b"OPN1", 1) + rack_key(0) + struct.pack("<I", 0))
+
+    assert len(OpeningBook(str(path))) == 0